@@ -1,13 +1,15 @@
-import traceback
 import os
+import sys
 
-from flask import Flask, request, jsonify
+from flask import Flask
 from flask_cors import CORS
-from flask_sqlalchemy import SQLAlchemy
-import bcrypt
-import jwt
-from datetime import datetime, timedelta
-from functools import wraps
+
+# The auth core is shared with the local backend (login-page/backend/app.py);
+# vercel.json bundles it with this function.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+# Serverless runtimes have no /dev/shm for a bcrypt process pool
+os.environ.setdefault('PASSWORD_POOL', 'thread')
+from auth_core import init_app  # noqa: E402
 
 app = Flask(__name__)
 
@@ -21,102 +23,16 @@ CORS(app, resources={
     }
 })
 
-# Use /tmp for SQLite on Vercel (ephemeral storage)
-db_path = os.path.join('/tmp', 'database.db')
-app.config['SQLALCHEMY_DATABASE_URI'] = f'sqlite:///{db_path}'
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'your-secret-key-change-in-production')
-
-db = SQLAlchemy(app)
-
-# User model
-class User(db.Model):
-    __tablename__ = 'user'
-    id = db.Column(db.Integer, primary_key=True)
-    email = db.Column(db.String(120), unique=True, nullable=False)
-    password = db.Column(db.String(100), nullable=False)
-
-    def __init__(self, email, password):
-        self.email = email
-        self.password = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
-
-    def check_password(self, password):
-        return bcrypt.checkpw(password.encode('utf-8'), self.password.encode('utf-8'))
-
-# JWT token required decorator
-def token_required(f):
-    @wraps(f)
-    def decorated(*args, **kwargs):
-        token = request.headers.get('Authorization')
-        if not token:
-            return jsonify({'error': 'Token is missing'}), 401
-        try:
-            data = jwt.decode(token.split()[1], app.config['SECRET_KEY'], algorithms=["HS256"])
-            current_user = User.query.filter_by(email=data['email']).first()
-        except Exception as e:
-            return jsonify({'error': f'Token is invalid: {str(e)}'}), 401
-        return f(current_user, *args, **kwargs)
-    return decorated
-
-# Create DB tables inside app context for local, but do it in routes for Vercel 
-# to avoid read-only init issues during cold start.
+# Without DATABASE_URL fall back to SQLite in /tmp (ephemeral storage on Vercel).
+# Complaint tracking needs COMPLAINTS_DATABASE_URL set to the database the action
+# server writes complaints to (e.g. a shared Postgres); until then it answers 503.
+init_app(
+    app,
+    url_prefix='/api',
+    default_database_url=f"sqlite:///{os.path.join('/tmp', 'database.db')}"
+)
 
 @app.route('/')
 def home():
     return "Backend is running (Vercel)"
-
-@app.route('/api/signup', methods=['POST', 'OPTIONS'])
-def signup():
-    if request.method == 'OPTIONS':
-        return '', 204
-    data = request.get_json()
-    email = data.get('email')
-    password = data.get('password')
-
-    # Ensure tables exist (Vercel cold start)
-    with app.app_context():
-        db.create_all()
-
-    if User.query.filter_by(email=email).first():
-        return jsonify({'error': 'User already exists'}), 409
-
-    new_user = User(email=email, password=password)
-    db.session.add(new_user)
-    db.session.commit()
-
-    return jsonify({'message': 'User created successfully'}), 201
-
-@app.route('/api/login', methods=['POST', 'OPTIONS'])
-def login():
-    if request.method == 'OPTIONS':
-        return '', 204
-    data = request.get_json()
-    email = data.get('email')
-    password = data.get('password')
-
-    # Ensure tables exist (Vercel cold start)
-    with app.app_context():
-        db.create_all()
-
-    user = User.query.filter_by(email=email).first()
-    if not user or not user.check_password(password):
-        return jsonify({'error': 'Invalid credentials'}), 401
-
-    token = jwt.encode({
-        'email': user.email,
-        'exp': datetime.utcnow() + timedelta(hours=24)
-    }, app.config['SECRET_KEY'])
-
-    return jsonify({
-        'message': 'Login successful',
-        'token': token,
-        'email': user.email
-    }), 200
-
-@app.route('/api/protected', methods=['GET'])
-@token_required
-def protected_route(current_user):
-    return jsonify({
-        'message': f'Hello {current_user.email}!',
-        'email': current_user.email
-    })
@@ -0,0 +1,55 @@
+"""Auth and complaint-tracking core shared by both Flask entrypoints.
+
+``login-page/backend/app.py`` (local/Docker) and ``api/index.py`` (Vercel)
+create their own Flask app, set deployment-specific defaults and then call
+``init_app``; everything else - models, password hashing, token caches,
+routes - lives here once. Imports are kept light for serverless cold starts:
+bcrypt pools, jwt and requests are only loaded when first used.
+"""
+
+from .auth import auth_blueprint, token_required
+from .chat import chat_blueprint
+from .db import configure_database, db, ensure_schema
+from .limits import RATE_LIMIT_TRUST_PROXY, Overloaded, RateLimited, retry_after_header
+from .metrics import metrics_blueprint, record_request, start_timer
+from .models import Complaint, User
+from .passwords import PasswordPoolBusy
+
+
+def init_app(app, url_prefix='', default_database_url='sqlite:///database.db', default_complaints_url=None):
+    configure_database(app, default_database_url, default_complaints_url)
+    db.init_app(app)
+
+    if RATE_LIMIT_TRUST_PROXY:
+        from werkzeug.middleware.proxy_fix import ProxyFix
+
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=RATE_LIMIT_TRUST_PROXY, x_proto=0)
+
+    app.before_request(start_timer)
+    app.after_request(record_request)
+
+    @app.before_request
+    def ensure_schema_ready():
+        ensure_schema(app)
+
+    @app.errorhandler(PasswordPoolBusy)
+    def password_pool_busy(e):
+        return {'error': 'Server busy, please retry'}, 503, {'Retry-After': '1'}
+
+    @app.errorhandler(Overloaded)
+    def overloaded(e):
+        return {'error': 'Server busy, please retry'}, 503, retry_after_header(e.retry_after)
+
+    @app.errorhandler(RateLimited)
+    def rate_limited(e):
+        return {'error': 'Too many requests, please slow down'}, 429, retry_after_header(e.retry_after)
+
+    app.register_blueprint(auth_blueprint, url_prefix=url_prefix or None)
+    app.register_blueprint(metrics_blueprint, url_prefix=url_prefix or None)
+    return app
+
+
+__all__ = [
+    'Complaint', 'Overloaded', 'PasswordPoolBusy', 'RateLimited', 'User', 'auth_blueprint', 'chat_blueprint',
+    'configure_database', 'db', 'ensure_schema', 'init_app', 'token_required',
+]
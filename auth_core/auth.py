@@ -0,0 +1,159 @@
+import base64
+from datetime import datetime, timedelta
+from functools import wraps
+
+import os
+
+from flask import Blueprint, current_app, g, jsonify, request
+from sqlalchemy import tuple_
+
+from .caches import load_user, token_cache, user_cache
+from .db import db
+from .limits import admission, client_ip, rate_limit, request_email
+from .models import Complaint, User
+
+auth_blueprint = Blueprint('auth', __name__)
+
+# Per-IP and per-account limits ('N/second|minute|hour', '0' disables) and in-flight caps
+SIGNUP_IP_LIMIT = os.environ.get('RATE_LIMIT_SIGNUP_IP', '10/minute')
+LOGIN_IP_LIMIT = os.environ.get('RATE_LIMIT_LOGIN_IP', '30/minute')
+LOGIN_USER_LIMIT = os.environ.get('RATE_LIMIT_LOGIN_USER', '10/minute')
+AUTH_MAX_IN_FLIGHT = int(os.environ.get('AUTH_MAX_IN_FLIGHT', 32))
+
+def encode_cursor(complaint):
+    raw = f"{complaint.created_at.isoformat()}|{complaint.complaint_id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor):
+    try:
+        created_at, complaint_id = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8').split('|', 1)
+        return datetime.fromisoformat(created_at), complaint_id
+    except Exception:
+        raise ValueError('Invalid cursor')
+
+# JWT token required decorator
+def token_required(f):
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        token = request.headers.get('Authorization')
+        if not token:
+            return jsonify({'error': 'Token is missing'}), 401
+
+        try:
+            token = token.split()[1]
+            data = token_cache.get(token)
+            if data is None:
+                import jwt  # deferred to the first uncached token to trim cold starts
+                data = jwt.decode(token, current_app.config['SECRET_KEY'], algorithms=["HS256"])
+                # Never serve a cached token past its own expiry
+                token_cache.set(token, data, expires_at=data.get('exp'))
+            current_user = load_user(data['email'])
+        except Exception:
+            return jsonify({'error': 'Token is invalid'}), 401
+        if current_user is None:
+            return jsonify({'error': 'User not found'}), 401
+        g.current_user = current_user
+
+        return f(current_user, *args, **kwargs)
+    return decorated
+
+@auth_blueprint.route('/signup', methods=['POST', 'OPTIONS'])
+@rate_limit('signup-ip', SIGNUP_IP_LIMIT, client_ip)
+@admission(AUTH_MAX_IN_FLIGHT)
+def signup():
+    if request.method == 'OPTIONS':
+        return '', 204
+    data = request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+
+    if User.query.filter_by(email=email).first():
+        return jsonify({'error': 'User already exists'}), 409
+
+    new_user = User(email=email, password=password)
+    db.session.add(new_user)
+    db.session.commit()
+    user_cache.pop(email)
+
+    return jsonify({'message': 'User created successfully'}), 201
+
+@auth_blueprint.route('/login', methods=['POST', 'OPTIONS'])
+@rate_limit('login-ip', LOGIN_IP_LIMIT, client_ip)
+@rate_limit('login-user', LOGIN_USER_LIMIT, request_email)
+@admission(AUTH_MAX_IN_FLIGHT)
+def login():
+    if request.method == 'OPTIONS':
+        return '', 204
+    data = request.get_json()
+    email = data.get('email')
+    password = data.get('password')
+
+    user = User.query.filter_by(email=email).first()
+    if not user or not user.check_password(password):
+        return jsonify({'error': 'Invalid credentials'}), 401
+
+    # Upgrade hashes made with a different BCRYPT_ROUNDS while we have the plaintext
+    if user.needs_rehash():
+        user.set_password(password)
+        db.session.commit()
+
+    # Create JWT token
+    import jwt
+    token = jwt.encode({
+        'email': user.email,
+        'exp': datetime.utcnow() + timedelta(hours=24)
+    }, current_app.config['SECRET_KEY'])
+
+    return jsonify({
+        'message': 'Login successful',
+        'token': token,
+        'email': user.email
+    }), 200
+
+@auth_blueprint.route('/protected', methods=['GET'])
+@token_required
+def protected_route(current_user):
+    return jsonify({
+        'message': f'Hello {current_user.email}!',
+        'email': current_user.email
+    })
+
+def complaint_tracking(f):
+    @wraps(f)
+    def decorated(*args, **kwargs):
+        if not current_app.config.get('COMPLAINT_TRACKING'):
+            return jsonify({'error': 'Complaint tracking is not configured'}), 503
+        return f(*args, **kwargs)
+    return decorated
+
+@auth_blueprint.route('/complaints/<complaint_id>', methods=['GET'])
+@complaint_tracking
+@token_required
+def get_complaint(current_user, complaint_id):
+    complaint = Complaint.query.filter_by(complaint_id=complaint_id, user_email=current_user.email).first()
+    if not complaint:
+        return jsonify({'error': 'Complaint not found'}), 404
+    return jsonify(complaint.to_dict())
+
+@auth_blueprint.route('/complaints', methods=['GET'])
+@complaint_tracking
+@token_required
+def list_complaints(current_user):
+    limit = min(max(request.args.get('limit', 20, type=int), 1), 100)
+    query = Complaint.query.filter_by(user_email=current_user.email)
+
+    # Keyset pagination: continue strictly after the last (created_at, complaint_id) seen
+    cursor = request.args.get('cursor')
+    if cursor:
+        try:
+            created_at, complaint_id = decode_cursor(cursor)
+        except ValueError:
+            return jsonify({'error': 'Invalid cursor'}), 400
+        query = query.filter(tuple_(Complaint.created_at, Complaint.complaint_id) < (created_at, complaint_id))
+
+    complaints = query.order_by(Complaint.created_at.desc(), Complaint.complaint_id.desc()).limit(limit + 1).all()
+    next_cursor = encode_cursor(complaints[limit - 1]) if len(complaints) > limit else None
+    return jsonify({
+        'complaints': [c.to_dict() for c in complaints[:limit]],
+        'next_cursor': next_cursor
+    })
@@ -0,0 +1,76 @@
+import os
+import threading
+import time
+from collections import OrderedDict, namedtuple
+
+from sqlalchemy import event
+
+from .metrics import request_metrics
+from .models import User
+
+# In-process caches for token_required: verified JWT claims and user rows
+class TTLCache:
+    def __init__(self, max_size, ttl):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expires_at=None):
+        expires_at = min(expires_at or float('inf'), time.time() + self.ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def pop(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def hit_ratio(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+CachedUser = namedtuple('CachedUser', ['id', 'email'])
+
+token_cache = TTLCache(int(os.environ.get('TOKEN_CACHE_SIZE', 10000)), int(os.environ.get('TOKEN_CACHE_TTL', 300)))
+user_cache = TTLCache(int(os.environ.get('USER_CACHE_SIZE', 10000)), int(os.environ.get('USER_CACHE_TTL', 60)))
+
+request_metrics.gauge('auth_cache_hit_ratio', 'Hit ratio of the token and user caches.', lambda: {
+    ('token',): token_cache.hit_ratio(),
+    ('user',): user_cache.hit_ratio()
+}, ['cache'])
+
+def load_user(email):
+    user = user_cache.get(email)
+    if user is None:
+        row = User.query.filter_by(email=email).first()
+        if row is None:
+            return None
+        user = CachedUser(row.id, row.email)
+        user_cache.set(email, user)
+    return user
+
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, target):
+    # Covers password changes and account removal
+    user_cache.pop(target.email)
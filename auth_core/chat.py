@@ -0,0 +1,180 @@
+import os
+import threading
+import time
+
+from flask import Blueprint, Response, jsonify, request
+
+from .auth import token_required
+from .limits import admission, client_ip, current_user_email, rate_limit
+from .metrics import request_metrics
+
+chat_blueprint = Blueprint('chat', __name__)
+
+# Rasa proxy: one keep-alive connection pool shared by all request threads.
+# Only connection failures are retried (the message never reached Rasa), and
+# a circuit breaker fails fast while Rasa is down instead of tying up workers.
+RASA_URL = os.environ.get('RASA_URL', 'http://localhost:5005').rstrip('/')
+RASA_CONNECT_TIMEOUT = float(os.environ.get('RASA_CONNECT_TIMEOUT', 3))
+RASA_READ_TIMEOUT = float(os.environ.get('RASA_READ_TIMEOUT', 60))  # drafts are translated before replying
+RASA_POOL_SIZE = int(os.environ.get('RASA_POOL_SIZE', 32))
+CHAT_IP_LIMIT = os.environ.get('RATE_LIMIT_CHAT_IP', '120/minute')
+CHAT_USER_LIMIT = os.environ.get('RATE_LIMIT_CHAT_USER', '60/minute')
+# More concurrent calls than pooled connections would only queue inside urllib3;
+# shared by both chat routes since they draw on the same pool
+CHAT_MAX_IN_FLIGHT = int(os.environ.get('CHAT_MAX_IN_FLIGHT', RASA_POOL_SIZE))
+chat_admission = admission(CHAT_MAX_IN_FLIGHT)
+
+class CircuitBreaker:
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            # After reset_timeout let a single request through to probe the backend
+            if not self._probing and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._probing = True
+                return True
+            return False
+
+    def is_open(self):
+        with self._lock:
+            return self._opened_at is not None
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._probing or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._probing = False
+
+    def retry_after(self):
+        with self._lock:
+            if self._opened_at is None:
+                return 0
+            return max(1, int(self.reset_timeout - (time.monotonic() - self._opened_at)))
+
+_rasa_session = None
+_rasa_session_lock = threading.Lock()
+
+def get_rasa_session():
+    # requests is only imported by deployments that actually proxy to Rasa
+    global _rasa_session
+    if _rasa_session is None:
+        with _rasa_session_lock:
+            if _rasa_session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = requests.Session()
+                retries = Retry(total=2, connect=2, read=0, status=0, other=0, allowed_methods=None, backoff_factor=0.2)
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=RASA_POOL_SIZE, max_retries=retries)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _rasa_session = session
+    return _rasa_session
+
+rasa_breaker = CircuitBreaker(
+    int(os.environ.get('RASA_BREAKER_THRESHOLD', 5)),
+    float(os.environ.get('RASA_BREAKER_RESET', 30))
+)
+
+request_metrics.gauge('rasa_circuit_open', '1 while the Rasa circuit breaker is rejecting requests.',
+                      lambda: {(): int(rasa_breaker.is_open())})
+
+@chat_blueprint.route('/rasa-webhook', methods=['POST'])
+@rate_limit('chat-ip', CHAT_IP_LIMIT, client_ip)
+@token_required
+@rate_limit('chat-user', CHAT_USER_LIMIT, current_user_email)
+@chat_admission
+def rasa_webhook(current_user):
+    data = request.get_json()
+    
+    if not rasa_breaker.allow():
+        return jsonify({'error': 'Chat service unavailable, please retry shortly'}), 503, {'Retry-After': str(rasa_breaker.retry_after())}
+
+    # Forward to Rasa with the authenticated email as sender_id
+    import requests
+    try:
+        response = get_rasa_session().post(
+            f'{RASA_URL}/webhooks/rest/webhook',
+            json={
+                "sender": current_user.email,  # This becomes tracker.sender_id in Rasa
+                "message": data.get('message', '')
+            },
+            timeout=(RASA_CONNECT_TIMEOUT, RASA_READ_TIMEOUT)
+        )
+        response.raise_for_status()
+        messages = response.json()
+    except requests.Timeout:
+        rasa_breaker.record_failure()
+        return jsonify({'error': 'Chat service timed out'}), 504
+    except (requests.RequestException, ValueError):
+        rasa_breaker.record_failure()
+        return jsonify({'error': 'Chat service unavailable'}), 502
+    rasa_breaker.record_success()
+
+    return jsonify(messages)
+
+@chat_blueprint.route('/rasa-webhook/stream', methods=['POST'])
+@rate_limit('chat-ip', CHAT_IP_LIMIT, client_ip)
+@token_required
+@rate_limit('chat-user', CHAT_USER_LIMIT, current_user_email)
+@chat_admission
+def rasa_webhook_stream(current_user):
+    """Like /rasa-webhook, but relays each bot message as a server-sent event as soon as Rasa emits it."""
+    data = request.get_json()
+
+    if not rasa_breaker.allow():
+        return jsonify({'error': 'Chat service unavailable, please retry shortly'}), 503, {'Retry-After': str(rasa_breaker.retry_after())}
+
+    # Rasa's REST channel writes one JSON message per line after each action
+    import requests
+    try:
+        response = get_rasa_session().post(
+            f'{RASA_URL}/webhooks/rest/webhook',
+            params={'stream': 'true'},
+            json={
+                "sender": current_user.email,
+                "message": data.get('message', '')
+            },
+            timeout=(RASA_CONNECT_TIMEOUT, RASA_READ_TIMEOUT),
+            stream=True
+        )
+        response.raise_for_status()
+    except requests.Timeout:
+        rasa_breaker.record_failure()
+        return jsonify({'error': 'Chat service timed out'}), 504
+    except requests.RequestException:
+        rasa_breaker.record_failure()
+        return jsonify({'error': 'Chat service unavailable'}), 502
+    rasa_breaker.record_success()
+
+    def events():
+        try:
+            for line in response.iter_lines():
+                if line:
+                    yield b'data: ' + line + b'\n\n'
+            yield b'event: end\ndata: {}\n\n'
+        except requests.RequestException:
+            rasa_breaker.record_failure()
+            yield b'event: error\ndata: {"error": "Chat service unavailable"}\n\n'
+        finally:
+            response.close()
+
+    # no-cache and X-Accel-Buffering stop proxies from holding events back
+    return Response(events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
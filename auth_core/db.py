@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import threading
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+db = SQLAlchemy()
+
+# Database engines. DATABASE_URL and COMPLAINTS_DATABASE_URL may point at
+# Postgres (needs psycopg2-binary; pooled, pre-pinged and recycled connections)
+# or SQLite (WAL with a busy timeout, so concurrent writers wait instead of
+# failing with "database is locked").
+SQLITE_JOURNAL_MODE = os.environ.get('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_BUSY_TIMEOUT = float(os.environ.get('SQLITE_BUSY_TIMEOUT', 30))
+# Off leaves SQLite's own defaults (rollback journal, synchronous=FULL), e.g. as a benchmark baseline
+SQLITE_PRAGMAS = os.environ.get('SQLITE_PRAGMAS', 'true').lower() in ('1', 'true', 'yes')
+
+def database_url(url):
+    # Heroku-style URLs use a scheme SQLAlchemy no longer accepts
+    if url.startswith('postgres://'):
+        url = 'postgresql://' + url[len('postgres://'):]
+    return url
+
+def engine_options(url):
+    if url.startswith('sqlite'):
+        return {'connect_args': {'timeout': SQLITE_BUSY_TIMEOUT}}
+    return {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+        'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 1800)),
+        'pool_pre_ping': True
+    }
+
+@event.listens_for(Engine, 'connect')
+def configure_sqlite(dbapi_connection, connection_record):
+    if not SQLITE_PRAGMAS or not isinstance(dbapi_connection, sqlite3.Connection):
+        return
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f'PRAGMA journal_mode={SQLITE_JOURNAL_MODE}')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA cache_size=-16000')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.close()
+
+def configure_database(app, default_url, default_complaints_url):
+    url = database_url(os.environ.get('DATABASE_URL', default_url))
+    complaints_url = os.environ.get('COMPLAINTS_DATABASE_URL') or default_complaints_url
+    # Without a complaints database the tracking routes answer 503 rather than
+    # "not found"; the bind still needs an engine, so it falls back to the main one
+    app.config['COMPLAINT_TRACKING'] = bool(complaints_url)
+    complaints_url = database_url(complaints_url or url)
+    app.config['SQLALCHEMY_DATABASE_URI'] = url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(url)
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    # The complaints table is written by the Rasa action server (chatbot/actions/complaint_store.py),
+    # which must be given the same COMPLAINTS_DATABASE_URL
+    app.config['SQLALCHEMY_BINDS'] = {
+        'complaints': {'url': complaints_url, **engine_options(complaints_url)}
+    }
+
+# Tables are created once per process by the first request that arrives, not
+# at import time (Vercel's filesystem may not be writable yet during init) and
+# not on every auth call.
+_schema_ready = False
+_schema_lock = threading.Lock()
+
+def ensure_schema(app):
+    global _schema_ready
+    if _schema_ready:
+        return
+    with _schema_lock:
+        if not _schema_ready:
+            with app.app_context():
+                db.create_all()
+            _schema_ready = True
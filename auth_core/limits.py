@@ -0,0 +1,182 @@
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+
+from flask import g, request
+
+logger = logging.getLogger(__name__)
+
+# Rate limiting and admission control. Rate limits are token buckets keyed by
+# client IP or by user; the default backend is per process, set
+# RATE_LIMIT_REDIS_URL to share buckets between workers and instances.
+# Admission control caps how many requests a route runs at once - extra
+# requests queue for up to a few seconds and are then turned away with 503,
+# so a burst cannot push everyone's latency up without bound.
+
+RATE_LIMIT_ENABLED = os.environ.get('RATE_LIMIT_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+ADMISSION_QUEUE_TIMEOUT = float(os.environ.get('ADMISSION_QUEUE_TIMEOUT', 2))
+
+def trusted_proxies(value):
+    # 'true' keeps its old meaning of a single proxy (Vercel, one nginx)
+    value = value.strip().lower()
+    if value in ('true', 'yes'):
+        return 1
+    return int(value) if value.isdigit() else 0
+
+# Number of reverse proxies in front of the app. init_app then lets ProxyFix
+# take the client address from X-Forwarded-For, counting that many hops from
+# the right, so a client cannot choose its own key by sending the header.
+RATE_LIMIT_TRUST_PROXY = trusted_proxies(os.environ.get('RATE_LIMIT_TRUST_PROXY', ''))
+
+class RateLimited(Exception):
+    def __init__(self, retry_after):
+        self.retry_after = retry_after
+
+class Overloaded(Exception):
+    def __init__(self, retry_after=1):
+        self.retry_after = retry_after
+
+PERIODS = {'second': 1, 'minute': 60, 'hour': 3600}
+
+def parse_limit(spec):
+    """'10/minute' -> (10 tokens per 60 seconds as a rate, burst of 10); '0' or '' disables."""
+    if not spec or spec == '0':
+        return None
+    count, _, period = spec.partition('/')
+    seconds = PERIODS.get(period.strip(), None) or float(period or 1)
+    count = float(count)
+    return count / seconds, count
+
+class MemoryBackend:
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def consume(self, key, rate, burst, cost=1):
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (burst, now))
+            tokens = min(burst, tokens + (now - updated) * rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed, 0 if allowed else (cost - tokens) / rate
+
+class RedisBackend:
+    # Refill and take in one round trip; Redis' own clock keeps instances consistent
+    SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+local retry = 0
+if tokens >= cost then tokens = tokens - cost else retry = (cost - tokens) / rate end
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(burst / rate) + 1)
+return tostring(retry)
+"""
+
+    def __init__(self, url):
+        import redis  # optional dependency, only needed for shared limits
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.2, socket_connect_timeout=0.2)
+        self._script = self._client.register_script(self.SCRIPT)
+
+    def consume(self, key, rate, burst, cost=1):
+        try:
+            retry_after = float(self._script(keys=[f'ratelimit:{key}'], args=[rate, burst, cost]))
+        except Exception as e:
+            # Fail open: an unreachable limiter must not take the login page down with it
+            logger.warning(f"Rate limit backend unavailable: {e}")
+            return True, 0
+        return retry_after == 0, retry_after
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                url = os.environ.get('RATE_LIMIT_REDIS_URL')
+                _backend = RedisBackend(url) if url else MemoryBackend()
+    return _backend
+
+# Keys
+def client_ip():
+    # Behind trusted proxies ProxyFix has already set remote_addr from X-Forwarded-For
+    return request.remote_addr or 'unknown'
+
+def request_email():
+    data = request.get_json(silent=True) or {}
+    return str(data.get('email') or '').strip().lower() or None
+
+def current_user_email():
+    user = g.get('current_user')
+    return user.email if user else None
+
+def rate_limit(scope, spec, key):
+    """Token-bucket limit on ``key()`` (skipped when it returns None); ``spec`` is e.g. '10/minute'."""
+    limit = parse_limit(spec) if RATE_LIMIT_ENABLED else None
+
+    def decorator(f):
+        if limit is None:
+            return f
+        rate, burst = limit
+
+        @wraps(f)
+        def limited(*args, **kwargs):
+            identity = key() if request.method != 'OPTIONS' else None
+            if identity is not None:
+                allowed, retry_after = get_backend().consume(f'{scope}:{identity}', rate, burst)
+                if not allowed:
+                    raise RateLimited(retry_after)
+            return f(*args, **kwargs)
+        return limited
+    return decorator
+
+def admission(max_in_flight, queue_timeout=ADMISSION_QUEUE_TIMEOUT):
+    """Run at most ``max_in_flight`` requests at once; others wait up to ``queue_timeout`` seconds.
+
+    The limit covers every route decorated by the returned decorator, so
+    routes that share a backend can share one budget.
+    """
+    slots = threading.BoundedSemaphore(max_in_flight) if max_in_flight > 0 else None
+
+    def decorator(f):
+        if slots is None:
+            return f
+
+        @wraps(f)
+        def admitted(*args, **kwargs):
+            if not slots.acquire(timeout=queue_timeout):
+                raise Overloaded()
+            try:
+                response = f(*args, **kwargs)
+            except BaseException:
+                slots.release()
+                raise
+            if getattr(response, 'is_streamed', False):
+                # A streamed body is still being produced after the view returns
+                response.call_on_close(slots.release)
+            else:
+                slots.release()
+            return response
+        return admitted
+    return decorator
+
+def retry_after_header(seconds):
+    return {'Retry-After': str(max(1, int(seconds + 0.999)))}
@@ -0,0 +1,92 @@
+import bisect
+import hmac
+import os
+import threading
+import time
+
+from flask import Blueprint, Response, g, request
+
+# Prometheus text metrics for the Flask backends: per-route latency histograms,
+# error counts and cache hit ratios. Recording is one bisect and a few
+# additions under a lock per request. Every process keeps its own numbers, so
+# scrape each worker (or run a single worker per container). Set METRICS_TOKEN
+# to require "Authorization: Bearer <token>" on /metrics, e.g. on Vercel.
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN', '')
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+metrics_blueprint = Blueprint('metrics', __name__)
+
+def _labels(names, values, extra=None):
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+class RequestMetrics:
+    def __init__(self):
+        self._latency = {}  # (endpoint, method, status) -> [bucket counts..., +Inf count], sum
+        self._lock = threading.Lock()
+        self._gauges = []
+
+    def observe(self, endpoint, method, status, seconds):
+        index = bisect.bisect_left(LATENCY_BUCKETS, seconds)
+        key = (endpoint, method, str(status))
+        with self._lock:
+            series = self._latency.get(key)
+            if series is None:
+                series = self._latency[key] = [[0] * (len(LATENCY_BUCKETS) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += seconds
+
+    def gauge(self, name, documentation, func, labelnames=()):
+        """Register a gauge read at scrape time; ``func`` returns {label values tuple: value}."""
+        self._gauges.append((name, documentation, func, tuple(labelnames)))
+
+    def render(self):
+        with self._lock:
+            latency = [(key, list(counts), total) for key, (counts, total) in self._latency.items()]
+        names = ('endpoint', 'method', 'status')
+        lines = [
+            '# HELP http_request_seconds Latency of HTTP requests by route and status.',
+            '# TYPE http_request_seconds histogram',
+        ]
+        errors = {}
+        for key, counts, total in latency:
+            cumulative = 0
+            for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float('inf') else f'le="{bound!r}"'
+                lines.append(f'http_request_seconds_bucket{_labels(names, key, le)} {cumulative}')
+            lines.append(f'http_request_seconds_sum{_labels(names, key)} {total}')
+            lines.append(f'http_request_seconds_count{_labels(names, key)} {cumulative}')
+            if key[2].startswith('5'):
+                errors[key[:2]] = errors.get(key[:2], 0) + cumulative
+        lines += [
+            '# HELP http_request_errors_total HTTP requests answered with a 5xx status.',
+            '# TYPE http_request_errors_total counter',
+        ]
+        lines += [f'http_request_errors_total{_labels(names[:2], key)} {count}' for key, count in errors.items()]
+        for name, documentation, func, labelnames in self._gauges:
+            lines += [f'# HELP {name} {documentation}', f'# TYPE {name} gauge']
+            lines += [f'{name}{_labels(labelnames, key)} {value}' for key, value in func().items()]
+        return '\n'.join(lines) + '\n'
+
+request_metrics = RequestMetrics()
+
+def start_timer():
+    g.request_started = time.perf_counter()
+
+def record_request(response):
+    started = g.pop('request_started', None)
+    if started is not None:
+        request_metrics.observe(request.endpoint or 'unmatched', request.method, response.status_code,
+                                time.perf_counter() - started)
+    return response
+
+@metrics_blueprint.route('/metrics', methods=['GET'])
+def metrics():
+    if METRICS_TOKEN:
+        supplied = request.headers.get('Authorization', '').partition(' ')[2]
+        if not hmac.compare_digest(supplied, METRICS_TOKEN):
+            return Response('Unauthorized\n', status=401, mimetype='text/plain')
+    return Response(request_metrics.render(), mimetype='text/plain; version=0.0.4')
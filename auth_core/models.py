@@ -0,0 +1,48 @@
+from .db import db
+from .passwords import BCRYPT_ROUNDS, bcrypt_rounds, hash_password, verify_password
+
+# User model
+class User(db.Model):
+    __tablename__ = 'user'
+    id = db.Column(db.Integer, primary_key=True)
+    email = db.Column(db.String(255), unique=True, nullable=False)
+    password = db.Column(db.String(100), nullable=False)
+
+    def __init__(self, email, password):
+        self.email = email
+        self.set_password(password)
+
+    def set_password(self, password):
+        self.password = hash_password(password)
+
+    def check_password(self, password):
+        return verify_password(password, self.password)
+
+    def needs_rehash(self):
+        return bcrypt_rounds(self.password) != BCRYPT_ROUNDS
+
+# Complaint records written by the Rasa action server (chatbot/actions/complaint_store.py)
+class Complaint(db.Model):
+    __bind_key__ = 'complaints'
+    __tablename__ = 'complaints'
+    complaint_id = db.Column(db.String(64), primary_key=True)
+    user_email = db.Column(db.String(), nullable=False)
+    state = db.Column(db.String(100))
+    area = db.Column(db.String(200))
+    department = db.Column(db.String(100))
+    details = db.Column(db.Text)
+    status = db.Column(db.String(32), nullable=False, default='registered')
+    created_at = db.Column(db.DateTime, nullable=False)
+    # Serves both the per-user listing and its keyset pagination
+    __table_args__ = (db.Index('complaints_by_user', 'user_email', 'created_at', 'complaint_id'),)
+
+    def to_dict(self):
+        return {
+            'complaint_id': self.complaint_id,
+            'state': self.state,
+            'area': self.area,
+            'department': self.department,
+            'details': self.details,
+            'status': self.status,
+            'created_at': self.created_at.isoformat(),
+        }
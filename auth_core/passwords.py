@@ -0,0 +1,62 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+
+# Password hashing. bcrypt is CPU-bound, so it runs on a bounded worker pool
+# instead of the request thread; when every slot is taken requests wait up to
+# PASSWORD_QUEUE_TIMEOUT seconds and then fail fast with 503. Serverless
+# runtimes have no /dev/shm for multiprocessing, so api/index.py defaults
+# PASSWORD_POOL to thread.
+BCRYPT_ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+PASSWORD_POOL = os.environ.get('PASSWORD_POOL', 'process')  # process, thread or inline
+PASSWORD_WORKERS = int(os.environ.get('PASSWORD_WORKERS', os.cpu_count() or 1))
+PASSWORD_QUEUE_SIZE = int(os.environ.get('PASSWORD_QUEUE_SIZE', PASSWORD_WORKERS * 4))
+PASSWORD_QUEUE_TIMEOUT = float(os.environ.get('PASSWORD_QUEUE_TIMEOUT', 5))
+
+class PasswordPoolBusy(Exception):
+    pass
+
+_password_slots = threading.BoundedSemaphore(PASSWORD_QUEUE_SIZE)
+_password_pool = None
+_password_pool_lock = threading.Lock()
+
+def get_password_pool():
+    global _password_pool
+    if _password_pool is None:
+        with _password_pool_lock:
+            if _password_pool is None:
+                if PASSWORD_POOL == 'process':
+                    # Imported here to keep multiprocessing off the cold-start path
+                    import multiprocessing
+                    from concurrent.futures import ProcessPoolExecutor
+                    _password_pool = ProcessPoolExecutor(PASSWORD_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+                else:
+                    # bcrypt releases the GIL, so threads still hash in parallel
+                    _password_pool = ThreadPoolExecutor(PASSWORD_WORKERS, thread_name_prefix='bcrypt')
+    return _password_pool
+
+def run_password_task(func, *args):
+    if PASSWORD_POOL == 'inline':
+        return func(*args)
+    if not _password_slots.acquire(timeout=PASSWORD_QUEUE_TIMEOUT):
+        raise PasswordPoolBusy()
+    try:
+        return get_password_pool().submit(func, *args).result()
+    finally:
+        _password_slots.release()
+
+def hash_password(password, rounds=None):
+    # bcrypt.hashpw/checkpw are plain module functions, so they pickle cheaply to worker processes
+    salt = bcrypt.gensalt(rounds or BCRYPT_ROUNDS)
+    return run_password_task(bcrypt.hashpw, password.encode('utf-8'), salt).decode('utf-8')
+
+def verify_password(password, hashed):
+    return run_password_task(bcrypt.checkpw, password.encode('utf-8'), hashed.encode('utf-8'))
+
+def bcrypt_rounds(hashed):
+    try:
+        return int(hashed.split('$')[2])
+    except (IndexError, ValueError):
+        return None
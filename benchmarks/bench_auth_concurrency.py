@@ -0,0 +1,88 @@
+"""Concurrent signup and login against the backend's SQLite database.
+
+Runs the same mixed workload twice: once with the old engine settings
+(no connection pragmas, so SQLite's rollback journal and synchronous=FULL,
+and pysqlite's default 5 second busy timeout) and once with
+the WAL configuration the backends now default to. bcrypt is turned down to
+its minimum cost so the database, not hashing, is the bottleneck. Non-2xx
+responses are counted per status; "database is locked" shows up as 500::
+
+    python benchmarks/bench_auth_concurrency.py --clients 32 --users 500
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from bench_utils import report, start_backend, stop_backend, summarize
+
+PROFILES = {
+    "legacy_rollback_journal": {"SQLITE_PRAGMAS": "0", "SQLITE_BUSY_TIMEOUT": "5"},
+    "wal": {"SQLITE_JOURNAL_MODE": "WAL"},
+}
+
+
+def run(profile, args):
+    tmp = tempfile.TemporaryDirectory()
+    env = {
+        **PROFILES[profile],
+        "DATABASE_URL": f"sqlite:///{tmp.name}/users.db",
+        "BCRYPT_ROUNDS": "4",
+        "PASSWORD_POOL": "inline",
+    }
+    server, base = start_backend(args.port, env)
+    latencies = {"signup": [], "login": []}
+    statuses = {"signup": {}, "login": {}}
+    lock = threading.Lock()
+    local = threading.local()
+
+    def call(kind, i):
+        session = getattr(local, "session", None) or requests.Session()
+        local.session = session
+        body = {"email": f"user{i}@example.org", "password": "bench-password"}
+        start = time.perf_counter()
+        response = session.post(f"{base}/{kind}", json=body)
+        with lock:
+            latencies[kind].append(time.perf_counter() - start)
+            statuses[kind][response.status_code] = statuses[kind].get(response.status_code, 0) + 1
+
+    def user_flow(i):
+        call("signup", i)
+        for _ in range(args.logins):
+            call("login", i)
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as pool:
+            list(pool.map(user_flow, range(args.users)))
+        elapsed = time.perf_counter() - start
+    finally:
+        stop_backend(server)
+        tmp.cleanup()
+
+    return {
+        kind: {**summarize(latencies[kind], elapsed), "statuses": statuses[kind]}
+        for kind in latencies
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--logins", type=int, default=2, help="logins per user after signing up")
+    parser.add_argument("--port", type=int, default=5099)
+    args = parser.parse_args()
+
+    report({
+        "clients": args.clients,
+        **{profile: run(profile, args) for profile in PROFILES},
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Cold and warm latency of the serverless entrypoint (api/index.py).
+
+Every trial runs in a fresh interpreter, the way a new serverless instance
+would, and records the module import time, the first signup and login
+(which pay for schema creation and lazy imports) and then the median of
+warm signups and logins. bcrypt runs at its minimum cost so hashing does
+not hide the difference. Pass ``--entrypoint`` to measure another copy,
+e.g. an older revision exported with ``git show``::
+
+    git show HEAD~1:api/index.py > /tmp/index_old.py
+    python benchmarks/bench_cold_start.py --entrypoint /tmp/index_old.py
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from bench_utils import ROOT, report
+
+CHILD = """
+import importlib.util, json, time
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("index", {entrypoint!r})
+backend = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(backend)
+result = {{"import_ms": (time.perf_counter() - start) * 1000}}
+client = backend.app.test_client()
+
+def timed(path, i):
+    start = time.perf_counter()
+    response = client.post(path, json={{"email": f"user{{i}}@example.org", "password": "bench-password"}})
+    assert response.status_code < 300, response.get_data(as_text=True)
+    return (time.perf_counter() - start) * 1000
+
+result["first_signup_ms"] = timed("/api/signup", 0)
+result["first_login_ms"] = timed("/api/login", 0)
+result["warm_signup_ms"] = sorted(timed("/api/signup", i) for i in range(1, {warm} + 1))[{warm} // 2]
+result["warm_login_ms"] = sorted(timed("/api/login", i) for i in range(1, {warm} + 1))[{warm} // 2]
+print(json.dumps(result))
+"""
+
+
+def trial(entrypoint, warm):
+    with tempfile.TemporaryDirectory() as tmp:
+        env = dict(
+            os.environ,
+            DATABASE_URL=f"sqlite:///{tmp}/users.db",
+            COMPLAINTS_DATABASE_URL=f"sqlite:///{tmp}/complaints.db",
+            BCRYPT_ROUNDS="4",
+            RATE_LIMIT_ENABLED="0",
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", CHILD.format(entrypoint=str(entrypoint), warm=warm)],
+            env=env, check=True, capture_output=True, text=True,
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entrypoint", default=str(ROOT / "api" / "index.py"))
+    parser.add_argument("--trials", type=int, default=10)
+    parser.add_argument("--warm", type=int, default=20, help="warm requests per trial and route")
+    args = parser.parse_args()
+
+    trials = [trial(args.entrypoint, args.warm) for _ in range(args.trials)]
+    report({
+        "entrypoint": args.entrypoint,
+        "trials": args.trials,
+        **{key: statistics.median(t[key] for t in trials) for key in trials[0]},
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Compare the offline language detector with the googletrans detect call.
+
+Samples are the language-annotated examples in chatbot/data/nlu.yml, e.g.
+``- नमस्ते (Hindi)``. The remote path needs network access and is skipped
+unless ``--remote`` is given::
+
+    python benchmarks/bench_language_detect.py --remote
+"""
+
+import argparse
+import re
+import time
+
+from bench_utils import CHATBOT_DIR, add_to_path, report, summarize
+
+add_to_path(CHATBOT_DIR)
+from actions.language_detect import detect_language  # noqa: E402
+from actions.prompts import SUPPORTED_LANGUAGES  # noqa: E402
+
+LANGUAGE_CODES = {name: code for code, name in SUPPORTED_LANGUAGES.items()}
+EXAMPLE_RE = re.compile(r"^\s*- (.*) \((\w+)\)\s*$")
+ENTITY_RE = re.compile(r"\[([^\]]*)\]\(\w+\)")
+
+
+def load_samples():
+    samples = []
+    with open(CHATBOT_DIR / "data" / "nlu.yml", encoding="utf-8") as f:
+        for line in f:
+            match = EXAMPLE_RE.match(line)
+            if match and match.group(2) in LANGUAGE_CODES:
+                samples.append((ENTITY_RE.sub(r"\1", match.group(1)), LANGUAGE_CODES[match.group(2)]))
+    return samples
+
+
+def run(detect, samples, repeat):
+    latencies, correct = [], 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for text, expected in samples:
+            t0 = time.perf_counter()
+            lang = detect(text)
+            latencies.append(time.perf_counter() - t0)
+            correct += lang == expected
+    elapsed = time.perf_counter() - start
+    return {"accuracy": correct / len(latencies), **summarize(latencies, elapsed)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=1000, help="passes over the samples for the local detector")
+    parser.add_argument("--remote", action="store_true", help="also time googletrans (needs network)")
+    args = parser.parse_args()
+
+    samples = load_samples()
+    results = {"samples": len(samples), "local": run(lambda t: detect_language(t)[0], samples, args.repeat)}
+    if args.remote:
+        from googletrans import Translator
+
+        # Mirrors the previous ActionDetectLanguage: a new Translator per message
+        results["remote"] = run(lambda t: Translator().detect(t).lang, samples, 1)
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
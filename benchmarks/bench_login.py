@@ -0,0 +1,90 @@
+"""Login throughput under a login storm, per password hashing mode.
+
+Starts the login-page backend once per ``PASSWORD_POOL`` mode (``inline``
+is the old behaviour of hashing on the request thread), hammers ``/login``
+from many concurrent clients and meanwhile probes the cheap ``/protected``
+route to show how much the storm slows down everything else::
+
+    python benchmarks/bench_login.py --clients 32 --requests 400 --rounds 12
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from bench_utils import report, start_backend, stop_backend, summarize
+
+
+def run(mode, args):
+    tmp = tempfile.TemporaryDirectory()
+    env = {"PASSWORD_POOL": mode, "BCRYPT_ROUNDS": str(args.rounds), "DATABASE_URL": f"sqlite:///{tmp.name}/users.db"}
+    if args.workers:
+        env["PASSWORD_WORKERS"] = str(args.workers)
+    server, base = start_backend(args.port, env)
+    try:
+        email, password = "bench@example.org", "bench-password"
+        requests.post(base + "/signup", json={"email": email, "password": password}).raise_for_status()
+        token = requests.post(base + "/login", json={"email": email, "password": password}).json()["token"]
+
+        login_latencies, probe_latencies, statuses = [], [], {}
+        done = threading.Event()
+        local = threading.local()
+
+        def login(_):
+            session = getattr(local, "session", None) or requests.Session()
+            local.session = session
+            start = time.perf_counter()
+            response = session.post(base + "/login", json={"email": email, "password": password})
+            login_latencies.append(time.perf_counter() - start)
+            statuses[response.status_code] = statuses.get(response.status_code, 0) + 1
+
+        def probe():
+            session = requests.Session()
+            headers = {"Authorization": f"Bearer {token}"}
+            while not done.is_set():
+                start = time.perf_counter()
+                session.get(base + "/protected", headers=headers)
+                probe_latencies.append(time.perf_counter() - start)
+                time.sleep(0.01)
+
+        prober = threading.Thread(target=probe)
+        prober.start()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as pool:
+            list(pool.map(login, range(args.requests)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        prober.join()
+        return {
+            "login": summarize(login_latencies, elapsed),
+            "login_statuses": statuses,
+            "protected_during_storm": summarize(probe_latencies),
+        }
+    finally:
+        stop_backend(server)
+        tmp.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=400)
+    parser.add_argument("--rounds", type=int, default=12, help="BCRYPT_ROUNDS for the run")
+    parser.add_argument("--workers", type=int, default=0, help="PASSWORD_WORKERS (default: CPU count)")
+    parser.add_argument("--modes", default="inline,thread,process")
+    parser.add_argument("--port", type=int, default=5099)
+    args = parser.parse_args()
+
+    report({
+        "clients": args.clients,
+        "bcrypt_rounds": args.rounds,
+        **{mode: run(mode, args) for mode in args.modes.split(",")},
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""Compare NLU pipeline profiles on intent accuracy, inference latency and load time.
+
+Each profile (``chatbot/config.yml`` and ``chatbot/config.fast.yml`` by
+default) is trained on the same split of ``chatbot/data/nlu.yml``. The
+model is then loaded in a fresh interpreter, as a new Rasa server would
+load it, and every held-out example is parsed one at a time. Needs Rasa
+installed (``pip install rasa==3.6.20``)::
+
+    python benchmarks/bench_nlu_profiles.py
+    python benchmarks/bench_nlu_profiles.py --config chatbot/config.fast.yml --train-frac 0.7
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from bench_utils import CHATBOT_DIR, report, summarize
+
+# Runs in a fresh interpreter per model so load time and memory are not
+# flattered by modules and models already loaded by earlier profiles
+EVALUATE = """
+import asyncio, json, resource, sys, time
+start = time.perf_counter()
+from rasa.core.agent import Agent
+from rasa.shared.nlu.training_data.loading import load_data
+agent = Agent.load(sys.argv[1])
+load_s = time.perf_counter() - start
+examples = load_data(sys.argv[2]).intent_examples
+
+async def parse_all():
+    results = []
+    for message in examples:
+        start = time.perf_counter()
+        parsed = await agent.parse_message(message.get("text"))
+        results.append((time.perf_counter() - start, parsed["intent"]["name"] == message.get("intent")))
+    return results
+
+results = asyncio.run(parse_all())
+print(json.dumps({
+    "load_s": load_s,
+    "latencies": [latency for latency, _ in results],
+    "correct": sum(correct for _, correct in results),
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def split_data(tmp, train_frac, seed):
+    from rasa.shared.nlu.training_data.loading import load_data
+
+    train, test = load_data(str(CHATBOT_DIR / "data" / "nlu.yml")).train_test_split(train_frac, seed)
+    train_path, test_path = tmp / "train.yml", tmp / "test.yml"
+    train.persist_nlu(str(train_path))
+    test.persist_nlu(str(test_path))
+    return train_path, test_path, len(test.intent_examples)
+
+
+def train(config, train_path, out):
+    start = time.perf_counter()
+    subprocess.run(
+        ["rasa", "train", "nlu", "--config", str(config), "--nlu", str(train_path),
+         "--out", str(out), "--fixed-model-name", config.stem],
+        cwd=CHATBOT_DIR, check=True, stdout=subprocess.DEVNULL,
+    )
+    return out / f"{config.stem}.tar.gz", time.perf_counter() - start
+
+
+def evaluate(model, test_path):
+    output = subprocess.run(
+        [sys.executable, "-c", EVALUATE, str(model), str(test_path)],
+        check=True, capture_output=True, text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--config", nargs="+", type=Path,
+                        default=[CHATBOT_DIR / "config.yml", CHATBOT_DIR / "config.fast.yml"])
+    parser.add_argument("--train-frac", type=float, default=0.8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        train_path, test_path, test_count = split_data(tmp, args.train_frac, args.seed)
+        results = {"test_examples": test_count}
+        for config in args.config:
+            model, train_s = train(config.resolve(), train_path, tmp / "models")
+            evaluation = evaluate(model, test_path)
+            latency = summarize(evaluation["latencies"])
+            results[config.name] = {
+                "intent_accuracy": evaluation["correct"] / max(1, test_count),
+                "inference_p50_ms": latency["p50_ms"],
+                "inference_p95_ms": latency["p95_ms"],
+                "load_s": evaluation["load_s"],
+                "train_s": train_s,
+                "model_mb": model.stat().st_size / 2**20,
+                "max_rss_mb": evaluation["max_rss_mb"],
+            }
+
+    report(results)
+
+
+if __name__ == "__main__":
+    main()
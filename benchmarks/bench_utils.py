@@ -0,0 +1,96 @@
+"""Shared helpers for the benchmark scripts in this directory."""
+
+import json
+import os
+import signal
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Sequence
+
+ROOT = Path(__file__).resolve().parent.parent
+CHATBOT_DIR = ROOT / "chatbot"
+BACKEND_DIR = ROOT / "login-page" / "backend"
+
+# Runs the login-page backend on a threaded dev server in a child process
+BACKEND_SERVER = """
+import sys
+sys.path.insert(0, {backend!r})
+import app as backend
+from auth_core import db
+with backend.app.app_context():
+    db.create_all()
+backend.app.run(port={port}, threaded=True)
+"""
+
+
+def add_to_path(*paths: Path) -> None:
+    for path in paths:
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies: Sequence[float], elapsed: float = 0.0) -> Dict[str, float]:
+    """Latency summary in milliseconds; ``elapsed`` (seconds) adds a throughput figure."""
+    summary = {
+        "count": len(latencies),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else 0.0,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "max_ms": max(latencies) * 1000 if latencies else 0.0,
+    }
+    if elapsed:
+        summary["rps"] = len(latencies) / elapsed
+    return summary
+
+
+def time_calls(func: Callable[[], object], iterations: int) -> List[float]:
+    latencies = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def start_backend(port: int, env: Dict[str, str]):
+    """Start the login-page backend with extra environment variables; returns (process, base_url)."""
+    import requests
+
+    server = subprocess.Popen(
+        [sys.executable, "-c", BACKEND_SERVER.format(backend=str(BACKEND_DIR), port=port)],
+        # Benchmarks drive far more traffic per client than the rate limits allow
+        env=dict(os.environ, RATE_LIMIT_ENABLED="0", **env), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(100):
+        try:
+            requests.get(base + "/", timeout=1)
+            return server, base
+        except requests.ConnectionError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError(f"Backend did not start on port {port}")
+
+
+def stop_backend(server: subprocess.Popen) -> None:
+    server.send_signal(signal.SIGINT)
+    try:
+        server.wait(timeout=10)
+    except subprocess.TimeoutExpired:
+        server.kill()
+
+
+def report(results: Dict[str, object]) -> None:
+    print(json.dumps(results, indent=2, ensure_ascii=False))
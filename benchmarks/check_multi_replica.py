@@ -0,0 +1,85 @@
+"""Check that Rasa replicas share conversations through the tracker and lock stores.
+
+Run against the load balancer from ``chatbot/docker-compose.scale.yml`` (which
+sends consecutive requests to different replicas), or list the replicas'
+own URLs to alternate between them explicitly::
+
+    docker compose -f chatbot/docker-compose.scale.yml up --build --scale rasa=3
+    python benchmarks/check_multi_replica.py --url http://localhost:5005
+
+Two checks, both using intent shortcuts (``/greet``) so NLU is not involved:
+
+``sequential``
+    One conversation's messages go round-robin over ``--url``; every replica
+    must then report every one of them in that conversation's tracker.
+``concurrent``
+    One conversation's messages are sent all at once; with a shared lock
+    store none of them may be lost to two replicas overwriting each other.
+
+Exits non-zero if a check fails; latency of the webhook calls is reported
+as JSON either way.
+"""
+
+import argparse
+import itertools
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from bench_utils import report, summarize
+
+
+def send(base, sender, message="/greet"):
+    start = time.perf_counter()
+    response = requests.post(f"{base}/webhooks/rest/webhook", json={"sender": sender, "message": message}, timeout=30)
+    response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def user_messages(base, sender):
+    response = requests.get(f"{base}/conversations/{sender}/tracker", params={"include_events": "ALL"}, timeout=30)
+    response.raise_for_status()
+    return sum(event["event"] == "user" for event in response.json()["events"])
+
+
+def check_sequential(urls, messages):
+    sender = f"replica-check-{uuid.uuid4().hex[:8]}"
+    latencies = [send(base, sender) for base, _ in zip(itertools.cycle(urls), range(messages))]
+    seen = {base: user_messages(base, sender) for base in urls}
+    return all(count == messages for count in seen.values()), {"user_messages": seen, **summarize(latencies)}
+
+
+def check_concurrent(urls, messages):
+    sender = f"replica-check-{uuid.uuid4().hex[:8]}"
+    targets = [base for base, _ in zip(itertools.cycle(urls), range(messages))]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(messages) as pool:
+        latencies = list(pool.map(lambda base: send(base, sender), targets))
+    elapsed = time.perf_counter() - start
+    seen = user_messages(urls[0], sender)
+    return seen == messages, {"user_messages": seen, **summarize(latencies, elapsed)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", nargs="+", default=["http://localhost:5005"],
+                        help="Rasa server or load balancer URLs, used round-robin")
+    parser.add_argument("--messages", type=int, default=12, help="messages per check")
+    args = parser.parse_args()
+
+    urls = [url.rstrip("/") for url in args.url]
+    results, passed = {"urls": urls, "messages": args.messages}, True
+    for name, check in (("sequential", check_sequential), ("concurrent", check_concurrent)):
+        ok, results[name] = check(urls, args.messages)
+        results[name]["passed"] = ok
+        passed = passed and ok
+
+    report(results)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""End-to-end load test of the grievance flow against local stand-ins.
+
+Two scenarios, both reported as JSON with p50/p95/p99 latency and requests
+per second so runs can be compared between releases:
+
+``flow``
+    Each virtual user signs up, logs in and files complaints through the
+    Flask backend's ``/rasa-webhook``. The backend forwards to a stand-in
+    Rasa server that runs ``action_submit_complaint`` from ``actions.py``
+    in-process, which sends its emails to a local aiosmtpd server.
+``actions``
+    Calls every custom action in ``actions.py`` directly, many at once.
+
+Nothing leaves the machine: googletrans is replaced by a fake with a
+configurable delay, SMTP goes to aiosmtpd (``pip install aiosmtpd``) and
+the databases live in a temporary directory::
+
+    python benchmarks/loadtest.py --scenario all --users 20 --messages 5 --lang hi
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from bench_utils import CHATBOT_DIR, add_to_path, report, start_backend, stop_backend, summarize
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+# --------------------------
+# Stand-ins
+# --------------------------
+
+def install_fake_googletrans(delay):
+    """Replace googletrans before actions.py imports it; texts come back unchanged after ``delay`` seconds."""
+
+    class Result:
+        def __init__(self, text, lang="en"):
+            self.text = text
+            self.lang = lang
+
+    class Translator:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def translate(self, text, dest="en", src="auto"):
+            time.sleep(delay)
+            return Result(text)
+
+        def detect(self, text):
+            time.sleep(delay)
+            return Result(text, lang="hi")
+
+    sys.modules["googletrans"] = types.SimpleNamespace(Translator=Translator)
+
+
+def start_smtp_server(port):
+    try:
+        from aiosmtpd.controller import Controller
+    except ImportError:
+        sys.exit("The load test needs aiosmtpd as its SMTP stand-in: pip install aiosmtpd")
+
+    class Sink:
+        received = 0
+
+        async def handle_DATA(self, server, session, envelope):
+            Sink.received += 1
+            return "250 OK"
+
+    controller = Controller(Sink(), hostname="127.0.0.1", port=port)
+    controller.start()
+    return controller, Sink
+
+
+class FakeTracker:
+    def __init__(self, sender_id, slots, text=""):
+        self.sender_id = sender_id
+        self.slots = slots
+        self.latest_message = {"text": text}
+
+    def get_slot(self, key):
+        return self.slots.get(key)
+
+
+class FakeDispatcher:
+    def __init__(self):
+        self.messages = []
+
+    def utter_message(self, text=None, **kwargs):
+        self.messages.append({"text": text, **kwargs})
+
+
+def complaint_slots(email, lang, details):
+    return {
+        "email": email, "language": lang, "state": "delhi", "area": "south delhi",
+        "department": "water", "complaint_details": details,
+    }
+
+
+class ActionRunner:
+    """Runs actions.py actions on one event loop thread, like the rasa_sdk action server does."""
+
+    def __init__(self, actions_module):
+        self.actions = {
+            cls().name(): cls for cls in actions_module.Action.__subclasses__()
+            if cls.__module__ == actions_module.__name__
+        }
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, name="action-loop", daemon=True).start()
+
+    async def run_async(self, name, tracker):
+        dispatcher = FakeDispatcher()
+        events = await self.actions[name]().run(dispatcher, tracker, {})
+        return dispatcher.messages, events
+
+    def run(self, name, tracker):
+        return asyncio.run_coroutine_threadsafe(self.run_async(name, tracker), self.loop).result()
+
+
+def start_fake_rasa(port, runner, lang):
+    class RasaHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            sender = payload["sender"]
+            tracker = FakeTracker(sender, complaint_slots(sender, lang, payload["message"]), payload["message"])
+            messages, _ = runner.run("action_submit_complaint", tracker)
+            body = json.dumps([{"recipient_id": sender, **m} for m in messages]).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", port), RasaHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-rasa", daemon=True).start()
+    return server
+
+
+# --------------------------
+# Scenarios
+# --------------------------
+
+def run_flow(args, rasa_port, tmp):
+    server, base = start_backend(free_port(), {
+        "DATABASE_URL": f"sqlite:///{tmp}/users.db",
+        "COMPLAINTS_DATABASE_URL": f"sqlite:///{tmp}/complaints.db",
+        "RASA_URL": f"http://127.0.0.1:{rasa_port}",
+        "BCRYPT_ROUNDS": str(args.bcrypt_rounds),
+        "RASA_POOL_SIZE": str(max(32, args.users)),
+    })
+    latencies = {"signup": [], "login": [], "rasa_webhook": []}
+    failures = {key: 0 for key in latencies}
+    lock = threading.Lock()
+
+    def timed(step, call):
+        start = time.perf_counter()
+        try:
+            response = call()
+            ok = response.status_code < 300
+        except requests.RequestException:
+            response, ok = None, False
+        with lock:
+            latencies[step].append(time.perf_counter() - start)
+            failures[step] += not ok
+        return response if ok else None
+
+    def virtual_user(i):
+        session = requests.Session()
+        email = f"loadtest{i}@example.org"
+        credentials = {"email": email, "password": "loadtest-password"}
+        timed("signup", lambda: session.post(f"{base}/signup", json=credentials))
+        response = timed("login", lambda: session.post(f"{base}/login", json=credentials))
+        if response is None:
+            return
+        headers = {"Authorization": f"Bearer {response.json()['token']}"}
+        for n in range(args.messages):
+            message = {"message": f"Complaint {n} from user {i}: no water supply since two days"}
+            timed("rasa_webhook", lambda: session.post(f"{base}/rasa-webhook", json=message, headers=headers))
+
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(args.users) as pool:
+            list(pool.map(virtual_user, range(args.users)))
+        elapsed = time.perf_counter() - start
+    finally:
+        stop_backend(server)
+
+    return {
+        "elapsed_s": elapsed,
+        **{step: {**summarize(samples, elapsed), "failures": failures[step]} for step, samples in latencies.items()},
+    }
+
+
+def run_actions(args, runner):
+    async def scenario():
+        semaphore = asyncio.Semaphore(args.concurrency)
+        latencies = {name: [] for name in runner.actions}
+
+        async def call(name, i):
+            email = f"actions{i}@example.org"
+            tracker = FakeTracker(email, complaint_slots(email, args.lang, "Streetlight broken"), "पानी नहीं आ रहा")
+            async with semaphore:
+                start = time.perf_counter()
+                await runner.run_async(name, tracker)
+                latencies[name].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call(name, i) for name in runner.actions for i in range(args.iterations)))
+        return latencies, time.perf_counter() - start
+
+    latencies, elapsed = asyncio.run_coroutine_threadsafe(scenario(), runner.loop).result()
+    return {
+        "elapsed_s": elapsed,
+        "all": summarize([s for samples in latencies.values() for s in samples], elapsed),
+        **{name: summarize(samples) for name, samples in sorted(latencies.items())},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", choices=["flow", "actions", "all"], default="all")
+    parser.add_argument("--users", type=int, default=20, help="concurrent virtual users (flow)")
+    parser.add_argument("--messages", type=int, default=5, help="complaints per virtual user (flow)")
+    parser.add_argument("--concurrency", type=int, default=50, help="actions in flight at once (actions)")
+    parser.add_argument("--iterations", type=int, default=50, help="runs per action (actions)")
+    parser.add_argument("--lang", default="hi", help="conversation language; 'en' skips translation")
+    parser.add_argument("--translate-delay", type=float, default=0.05, help="seconds per fake googletrans call")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4)
+    parser.add_argument("--outbox", action="store_true", help="queue emails in the outbox instead of sending inline")
+    parser.add_argument("--output", help="also write the JSON report to this file")
+    args = parser.parse_args()
+
+    tmp = tempfile.TemporaryDirectory()
+    smtp_port, rasa_port = free_port(), free_port()
+    smtp, sink = start_smtp_server(smtp_port)
+    os.environ.update({
+        "SMTP_SERVER": "127.0.0.1", "SMTP_PORT": str(smtp_port), "SMTP_USERNAME": "", "SMTP_PASSWORD": "",
+        "SMTP_SENDER": "grievances@example.org", "SMTP_STARTTLS": "false",
+        "EMAIL_OUTBOX_PATH": f"{tmp.name}/outbox.db" if args.outbox else "",
+        "COMPLAINTS_DATABASE_URL": f"sqlite:///{tmp.name}/complaints.db",
+        "TRANSLATION_CACHE_PATH": "", "METRICS_PORT": "0",
+    })
+    install_fake_googletrans(args.translate_delay)
+    add_to_path(CHATBOT_DIR)
+    from actions import actions as actions_module  # noqa: E402  (reads the environment above)
+
+    runner = ActionRunner(actions_module)
+    rasa = start_fake_rasa(rasa_port, runner, args.lang)
+    results = {"config": {k: v for k, v in vars(args).items() if k != "output"}}
+    try:
+        if args.scenario in ("flow", "all"):
+            results["flow"] = run_flow(args, rasa_port, tmp.name)
+        if args.scenario in ("actions", "all"):
+            results["actions"] = run_actions(args, runner)
+        results["emails_received"] = sink.received
+    finally:
+        rasa.shutdown()
+        smtp.stop()
+        if actions_module.email_outbox is not None:
+            actions_module.email_outbox.stop(timeout=5)
+        tmp.cleanup()
+
+    report(results)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,27 @@ from rasa_sdk.events import SlotSet
 from rasa_sdk.types import DomainDict
 from googletrans import Translator
 from pydantic import BaseSettings
-import smtplib
+import asyncio
+import functools
 import logging
 from datetime import datetime
-from hashlib import blake2b
 import os
-import yaml
+import re
+import threading
 from pathlib import Path
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from .complaint_ids import complaint_ids
+from .complaint_store import ComplaintStore
+from .language_detect import detect_language
+from .metrics import GaugeCallback, instrument_actions, registry, start_http_server, track
+from .outbox import EmailOutbox
+from .prompt_catalog import PromptCatalog
+from .prompts import DRAFT_EMAIL_TEMPLATE, PROMPT_TEMPLATES, STATIC_PROMPTS, SUPPORTED_LANGUAGES, protect_placeholders, restore_placeholders
+from .routing import DepartmentRouter
+from .smtp_pool import SMTPConnectionPool
+from .translation_cache import TranslationCache
 
 # --------------------------
 # Configuration and Constants
@@ -30,6 +43,30 @@ class Settings(BaseSettings):
     smtp_port: int = 587
     smtp_username: str = os.getenv("SMTP_USERNAME", "")
     smtp_password: str = os.getenv("SMTP_PASSWORD", "")
+    smtp_sender: str = ""  # defaults to smtp_username
+    smtp_starttls: bool = True
+    smtp_timeout: float = 30.0
+    smtp_pool_size: int = 4
+    smtp_keepalive_interval: float = 60.0
+    smtp_max_session_age: float = 600.0
+    email_outbox_path: str = str(Path(__file__).parent / "outbox.db")  # empty sends synchronously
+    email_outbox_workers: int = 2
+    email_outbox_max_attempts: int = 8
+    email_send_deadline: float = 45.0
+    routing_reload_interval: float = 5.0
+    # Where complaints are recorded for the tracking API; point the Flask backend's
+    # COMPLAINTS_DATABASE_URL at the same database. Empty disables tracking.
+    complaints_database_url: str = f"sqlite:///{Path(__file__).parent / 'complaints.db'}"
+    translation_cache_size: int = 10000
+    translation_cache_ttl: int = 7 * 24 * 3600
+    translation_cache_path: str = ""  # empty keeps the cache in memory only
+    translation_timeout: float = 5.0
+    translation_max_concurrency: int = 32
+    # Below this local detector confidence, ask googletrans instead
+    language_detect_threshold: float = 0.7
+    metrics_port: int = 9102  # 0 disables the Prometheus /metrics endpoint
+    metrics_host: str = "127.0.0.1"  # the endpoint has no auth; only bind wider behind a firewall
+    prompt_catalog_required: bool = False  # refuse to start without config/prompt_catalog.json
 
 
 settings = Settings()
@@ -37,76 +74,310 @@ settings = Settings()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-SUPPORTED_LANGUAGES = {
-    "en": "English", "hi": "Hindi", "mr": "Marathi", "ta": "Tamil", "te": "Telugu",
-    "kn": "Kannada", "bn": "Bengali", "gu": "Gujarati", "pa": "Punjabi",
-    "or": "Odia", "ml": "Malayalam", "as": "Assamese", "ne": "Nepali"
-}
-
 CONFIG_DIR = Path(__file__).parent / "config"
-with open(CONFIG_DIR / "dept_emails.yml") as f:
-    DEPT_EMAILS = yaml.safe_load(f)
+# Reloaded automatically when dept_emails.yml changes on disk
+department_router = DepartmentRouter(CONFIG_DIR / "dept_emails.yml", reload_interval=settings.routing_reload_interval)
+
+# Shared by every TranslationService instance for the lifetime of the action server
+translation_cache = TranslationCache(
+    max_size=settings.translation_cache_size,
+    ttl=settings.translation_cache_ttl,
+    path=settings.translation_cache_path or None,
+)
+
+# One googletrans client (and HTTP connection pool) for the whole action server.
+# Its blocking calls run on a bounded pool so they never stall the event loop.
+shared_translator = Translator(timeout=settings.translation_timeout)
+translation_executor = ThreadPoolExecutor(
+    max_workers=settings.translation_max_concurrency, thread_name_prefix="translate"
+)
+
+# Authenticated SMTP sessions reused across sends instead of a TLS handshake and login per email
+smtp_pool = SMTPConnectionPool(
+    host=settings.smtp_server,
+    port=settings.smtp_port,
+    username=settings.smtp_username,
+    password=settings.smtp_password,
+    starttls=settings.smtp_starttls,
+    max_size=settings.smtp_pool_size,
+    timeout=settings.smtp_timeout,
+    keepalive_interval=settings.smtp_keepalive_interval,
+    max_age=settings.smtp_max_session_age,
+)
+
+# Runs blocking SMTP sends so several can be in flight without stalling the event loop
+email_executor = ThreadPoolExecutor(max_workers=settings.smtp_pool_size, thread_name_prefix="email")
+
+# Batched misses are joined into one request on a separator line the translator leaves alone
+BATCH_SEPARATOR = "\n|||\n"
+BATCH_SPLIT_RE = re.compile(r"\s*\|\s*\|\s*\|\s*")
+BATCH_MAX_CHARS = 4500  # stay under googletrans' 5000 character request limit
+
+# Offline translations of STATIC_PROMPTS and PROMPT_TEMPLATES, loaded once at startup
+prompt_catalog = PromptCatalog.load(required=settings.prompt_catalog_required)
 
 # --------------------------
 # Core Services
 # --------------------------
 
 class TranslationService:
-    def __init__(self):
-        self.translator = Translator()
-        self.cache = {}
-
-    def translate(self, text: str, dest_lang: str, tracker: Optional[Tracker] = None) -> str:
-        if dest_lang == "en" or not text:
-            return text
-        key = f"{dest_lang}:{text}"
-        if key in self.cache:
-            return self.cache[key]
+    """Translation backed by the prompt catalog, the shared cache and, on a miss, googletrans.
+
+    googletrans is a blocking client, so remote calls run on a bounded thread pool
+    that shares one Translator (and its HTTP connection pool) across the action
+    server. Each call is capped by ``translation_timeout`` so a slow upstream never
+    stalls the event loop or other conversations.
+    """
+
+    # Misses being translated right now, by (dest_lang, text); later requests for
+    # the same text await the first one instead of calling googletrans again
+    _in_flight: Dict[Tuple[str, str], "asyncio.Future[Optional[str]]"] = {}
+
+    def __init__(self, cache: Optional[TranslationCache] = None, catalog: Optional[PromptCatalog] = None):
+        self.translator = shared_translator
+        self.cache = cache if cache is not None else translation_cache
+        self.catalog = catalog if catalog is not None else prompt_catalog
+
+    async def translate(self, text: str, dest_lang: str, tracker: Optional[Tracker] = None) -> str:
+        if tracker and "{" in text:
+            return await self.translate_template(text, dest_lang, **slot_values(tracker))
+        return (await self.translate_many([text], dest_lang))[0]
+
+    async def translate_many(self, texts: List[str], dest_lang: str) -> List[str]:
+        """Translate a batch in order, serving known strings locally and the rest in one request.
+
+        ``{placeholder}`` fields are preserved, so templates can be warmed in the
+        same batch as free text. Strings that fail to translate come back unchanged.
+        """
+        if dest_lang == "en":
+            return list(texts)
+        with track("translate"):
+            results = await self._translate_many(texts, dest_lang)
+        return [result if result is not None else text for text, result in zip(texts, results)]
+
+    async def translate_template(self, template: str, dest_lang: str, **values: Any) -> str:
+        """Translate a ``{placeholder}`` template once per language, then fill in the values.
+
+        Values are substituted verbatim; translate user-written free text separately.
+        """
+        if dest_lang == "en" or not template:
+            return template.format(**values)
+        skeleton = (await self._translate_many([template], dest_lang))[0]
+        try:
+            if skeleton is not None:
+                return skeleton.format(**values)
+        except (KeyError, IndexError, ValueError) as e:
+            logger.error(f"Translated template unusable ({dest_lang}): {e}")
+        # Placeholders did not survive translation; translate the rendered text instead
+        return await self.translate(template.format(**values), dest_lang)
+
+    async def detect(self, text: str) -> Optional[str]:
+        if not text:
+            return None
+        try:
+            with track("googletrans_detect"):
+                return await self._run(lambda: self.translator.detect(text).lang)
+        except Exception as e:
+            logger.error(f"Language detection error: {e!r}")
+            return None
+
+    async def _translate_many(self, texts: List[str], dest_lang: str) -> List[Optional[str]]:
+        found: Dict[str, Optional[str]] = {}
+        misses: List[str] = []
+        for text in dict.fromkeys(texts):
+            known = self._lookup(dest_lang, text) if text else text
+            if known is not None:
+                found[text] = known
+            else:
+                misses.append(text)
+
+        waiting: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        owned: Dict[str, "asyncio.Future[Optional[str]]"] = {}
+        loop = asyncio.get_running_loop()
+        for text in misses:
+            pending = self._in_flight.get((dest_lang, text))
+            if pending is not None:
+                waiting[text] = pending
+            else:
+                owned[text] = self._in_flight[(dest_lang, text)] = loop.create_future()
+
+        try:
+            if owned:
+                batches = list(self._batches(list(owned)))
+                translated = await asyncio.gather(*(self._translate_batch(batch, dest_lang) for batch in batches))
+                for batch, results in zip(batches, translated):
+                    for text, result in zip(batch, results):
+                        found[text] = result
+                        if result is not None:
+                            self.cache.set(dest_lang, text, result)
+                        owned[text].set_result(result)
+        finally:
+            for text, future in owned.items():
+                self._in_flight.pop((dest_lang, text), None)
+                if not future.done():
+                    future.set_result(None)  # failed or cancelled; waiters keep the source text
+
+        for text, pending in waiting.items():
+            found[text] = await asyncio.shield(pending)
+        return [found[text] for text in texts]
+
+    async def _translate_batch(self, texts: List[str], dest_lang: str) -> List[Optional[str]]:
+        protected = [protect_placeholders(text) for text in texts]
+        if len(texts) > 1:
+            try:
+                joined = await self._run(self._remote_translate, BATCH_SEPARATOR.join(p for p, _ in protected), dest_lang)
+                parts = BATCH_SPLIT_RE.split(joined.strip())
+                if len(parts) == len(texts):
+                    return [restore_placeholders(part, names) for part, (_, names) in zip(parts, protected)]
+                logger.warning(f"Batched translation returned {len(parts)} parts for {len(texts)} texts; retrying one by one")
+            except Exception as e:
+                logger.error(f"Batched translation error ({dest_lang}): {e!r}")
+        return list(await asyncio.gather(
+            *(self._translate_one(p, names, dest_lang) for p, names in protected)
+        ))
+
+    async def _translate_one(self, protected: str, names: List[str], dest_lang: str) -> Optional[str]:
         try:
-            if tracker and "{" in text:
-                text = text.format(
-                    state=tracker.get_slot("state") or "",
-                    area=tracker.get_slot("area") or "",
-                    department=tracker.get_slot("department") or "",
-                    language=tracker.get_slot("language") or "en"
-                )
-            result = self.translator.translate(text, dest=dest_lang).text
-            self.cache[key] = result
-            return result
+            return restore_placeholders(await self._run(self._remote_translate, protected, dest_lang), names)
         except Exception as e:
-            logger.error(f"Translation error ({dest_lang}): {e}")
-            return text
+            logger.error(f"Translation error ({dest_lang}): {e!r}")
+            return None
+
+    @staticmethod
+    def _batches(texts: List[str]):
+        batch, size = [], 0
+        for text in texts:
+            if batch and size + len(text) > BATCH_MAX_CHARS:
+                yield batch
+                batch, size = [], 0
+            batch.append(text)
+            size += len(text) + len(BATCH_SEPARATOR)
+        if batch:
+            yield batch
+
+    def _lookup(self, dest_lang: str, text: str) -> Optional[str]:
+        precompiled = self.catalog.get(dest_lang, text)
+        if precompiled is not None:
+            return precompiled
+        return self.cache.get(dest_lang, text)
+
+    def _remote_translate(self, text: str, dest_lang: str) -> str:
+        with track("googletrans"):
+            return self.translator.translate(text, dest=dest_lang).text
+
+    @staticmethod
+    async def _run(func, *args):
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(translation_executor, func, *args)
+        return await asyncio.wait_for(future, timeout=settings.translation_timeout)
 
 class EmailService:
     @staticmethod
     def send_email(recipient: str, subject: str, body: str, reply_to: str = None) -> Tuple[bool, Optional[str]]:
+        with track("smtp") as call:
+            ok, error = EmailService._send_email(recipient, subject, body, reply_to)
+            call.failed = not ok
+        return ok, error
+
+    @staticmethod
+    def _send_email(recipient: str, subject: str, body: str, reply_to: str = None) -> Tuple[bool, Optional[str]]:
         try:
             from email.message import EmailMessage
             msg = EmailMessage()
             msg["Subject"] = str(subject)
-            msg["From"] = str(settings.smtp_username)
+            msg["From"] = str(settings.smtp_sender or settings.smtp_username)
             msg["To"] = str(recipient)
             if reply_to:
                 msg["Reply-To"] = str(reply_to)
             msg.set_content(str(body))
-            with smtplib.SMTP(str(settings.smtp_server), int(settings.smtp_port)) as server:
-                server.starttls()
-                server.login(settings.smtp_username, settings.smtp_password)
-                server.send_message(msg)
+            smtp_pool.send_message(msg)
             return (True, None)
         except Exception as e:
             error_msg = f"Email sending failed to {recipient}: {e}"
             logger.error(error_msg)
             return (False, str(e))
 
+    @staticmethod
+    async def send_emails(*emails: Dict[str, Any], deadline: Optional[float] = None) -> List[Tuple[Optional[bool], Optional[str]]]:
+        """Send several emails concurrently, waiting at most ``deadline`` seconds.
+
+        Emails still queued at the deadline are cancelled and count as failed.
+        Emails already being sent are left to finish and reported as
+        ``(None, reason)``: they may still arrive, so they must not be retried.
+        """
+        futures = [
+            email_executor.submit(EmailService.send_email, **email)
+            for email in emails
+        ]
+        await asyncio.wait([asyncio.wrap_future(future) for future in futures], timeout=deadline)
+        results = []
+        for email, future in zip(emails, futures):
+            if future.done():
+                results.append(future.result())
+            elif future.cancel():
+                logger.error(f"Email to {email['recipient']} not sent, still queued after the {deadline}s deadline")
+                results.append((False, f"Timed out after {deadline:.0f} seconds"))
+            else:
+                logger.warning(f"Email to {email['recipient']} still sending after the {deadline}s deadline")
+                results.append((None, f"Still sending after {deadline:.0f} seconds"))
+        return results
+
+# Complaint records behind the tracking API of the Flask backends. Opened on first
+# use, so an unreachable database does not stop the action server from starting.
+complaint_store: Optional[ComplaintStore] = None
+complaint_store_lock = threading.Lock()
+
+def get_complaint_store() -> Optional[ComplaintStore]:
+    global complaint_store
+    with complaint_store_lock:
+        if complaint_store is None and settings.complaints_database_url:
+            complaint_store = ComplaintStore(settings.complaints_database_url)
+        return complaint_store
+
+# Durable queue for complaint emails, drained in the background with retries
+email_outbox = None
+if settings.email_outbox_path:
+    email_outbox = EmailOutbox(
+        settings.email_outbox_path,
+        EmailService.send_email,
+        workers=settings.email_outbox_workers,
+        max_attempts=settings.email_outbox_max_attempts,
+    )
+    email_outbox.start()
+
 # --------------------------
 # Utilities
 # --------------------------
 
 def generate_complaint_id(state: str, department: str) -> str:
-    h = blake2b(digest_size=4)
-    h.update(f"{state}{department}{datetime.now()}".encode())
-    return f"{state[:3].upper()}-{department[:3].upper()}-{h.hexdigest().upper()}"
+    return complaint_ids.generate(state, department)
+
+def slot_values(tracker: Tracker) -> Dict[str, str]:
+    return {
+        "state": tracker.get_slot("state") or "",
+        "area": tracker.get_slot("area") or "",
+        "department": tracker.get_slot("department") or "",
+        "language": tracker.get_slot("language") or "en",
+    }
+
+async def record_complaint(complaint_id: str, user_email: str, state: str, area: str, department: str, details: str,
+                           status: str = "registered") -> None:
+    """Save the complaint for tracking on a worker thread, off the event loop."""
+    if not settings.complaints_database_url:
+        return
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(
+        None, functools.partial(save_complaint, complaint_id, user_email, state, area, department, details, status)
+    )
+
+def save_complaint(complaint_id: str, user_email: str, state: str, area: str, department: str, details: str,
+                   status: str) -> None:
+    try:
+        with track("complaint_db"):
+            get_complaint_store().save(complaint_id, user_email, state, area, department, details, status=status)
+    except Exception as e:
+        # Tracking is best effort; the emails remain the record of the complaint
+        logger.error(f"Failed to record complaint {complaint_id}: {e}")
 
 def validate_required_slots(tracker: Tracker) -> None:
     for slot in ["state", "area", "department", "complaint_details"]:
@@ -157,12 +428,12 @@ class ActionDetectLanguage(Action):
 
     async def run(self, dispatcher, tracker, domain):
         user_text = tracker.latest_message.get("text", "")
-        lang = "en"
-        try:
-            detected = Translator().detect(user_text).lang
-            lang = detected if detected in SUPPORTED_LANGUAGES else "en"
-        except Exception as e:
-            logger.error(f"Language detection error: {e}")
+        with track("language_detect"):
+            detected, confidence = detect_language(user_text)
+        if confidence < settings.language_detect_threshold:
+            remote = await TranslationService().detect(user_text)
+            detected = remote or detected
+        lang = detected if detected in SUPPORTED_LANGUAGES else "en"
         return [SlotSet("language", lang)]
 
 class ActionGenerateDraft(Action):
@@ -187,18 +458,21 @@ class ActionGenerateDraft(Action):
             lang = tracker.get_slot("language") or "en"
             ts = TranslationService()
 
-            email_text = (
-                f"Subject: Grievance Submission Regarding the {normalize_department(slots['department'])} Department in {slots['area']}, {slots['state']}\n\n"
-                f"Dear Sir/Madam,\n\n"
-                f"I am writing to formally raise a concern regarding an issue related to the {normalize_department(slots['department'])} department in {slots['area']}, {slots['state']}.\n\n"
-                f"Details of the issue:\n{slots['complaint_details']}\n\n"
-                f"I kindly request that this matter be addressed at the earliest convenience.\n\n"
-                f"Thank you for your attention to this issue.\n\n"
-                f"Sincerely,\nA Concerned Citizen"
-            )
-
+            values = {
+                "department": normalize_department(slots["department"]),
+                "area": slots["area"],
+                "state": slots["state"],
+                "complaint_details": slots["complaint_details"],
+            }
+            email_text = DRAFT_EMAIL_TEMPLATE.format(**values)
             logger.info(f"📧 Draft Email:\n{email_text}")
-            dispatcher.utter_message(text=ts.translate("Here is your draft email:\n\n" + email_text, lang, tracker))
+
+            # Only the citizen's own words need a per-request translation; the
+            # draft skeleton rides along in the same batch when it is not cached yet
+            _, values["complaint_details"] = await ts.translate_many(
+                [PROMPT_TEMPLATES["draft"], slots["complaint_details"]], lang
+            )
+            dispatcher.utter_message(text=await ts.translate_template(PROMPT_TEMPLATES["draft"], lang, **values))
 
         except Exception as e:
             logger.error(f"🚨 Error in draft generation: {e}")
@@ -223,15 +497,13 @@ class ActionSubmitComplaint(Action):
             user_email = tracker.get_slot("email")
 
             if not user_email:
-                error_msg = ts.translate("⚠️ Complaint submission failed!", lang)
+                error_msg = await ts.translate(STATIC_PROMPTS["submit_failed"], lang)
                 dispatcher.utter_message(text=error_msg)
                 return []
 
             complaint_id = generate_complaint_id(state, dept)
-            recipient = (
-                DEPT_EMAILS.get(state, {}).get(dept) or
-                DEPT_EMAILS.get("default", {}).get("default")
-            )
+            with track("routing"):
+                recipient = department_router.lookup(state, dept, district=area)
             if not recipient:
                 raise ValueError(f"No email for department '{dept}' in state '{state}'")
 
@@ -247,14 +519,6 @@ class ActionSubmitComplaint(Action):
                 f"---\nThis is an automated email from the Central Grievance Portal.\nPlease do not reply directly to this message."
             )
 
-            # Send to department and capture the actual error
-            sent_to_dept, error_dept = EmailService.send_email(recipient, subject, body, reply_to=user_email)
-            if not sent_to_dept:
-                # Display the real error in chat
-                error_msg = ts.translate(f"⚠️ Failed to send email to the department. **Reason:** {error_dept}", lang)
-                dispatcher.utter_message(text=error_msg)
-                return [SlotSet("complaint_id", None)]
-
             confirmation_subject = f"Complaint Registered: {complaint_id}"
             confirmation_body = (
                 f"Dear Citizen,\n\n"
@@ -270,24 +534,53 @@ class ActionSubmitComplaint(Action):
                 f"Regards,\nCentral Grievance Cell"
             )
 
-            # Send confirmation to user and capture the actual error
-            sent_to_user, error_user = EmailService.send_email(user_email, confirmation_subject, confirmation_body)
-            if not sent_to_user:
+            if email_outbox is not None:
+                # Delivery and retries happen in the background; reply with the ID right away
+                await record_complaint(complaint_id, user_email, state, area, dept, complaint)
+                with track("outbox"):
+                    email_outbox.enqueue(f"{complaint_id}:department", recipient, subject, body, reply_to=user_email)
+                    email_outbox.enqueue(f"{complaint_id}:citizen", user_email, confirmation_subject, confirmation_body)
+                success_msg = await ts.translate_template(PROMPT_TEMPLATES["submit_success"], lang, complaint_id=complaint_id)
+                dispatcher.utter_message(text=success_msg)
+                return [SlotSet("complaint_id", complaint_id)]
+
+            # Send both emails at once so the user waits for the slower one, not the sum
+            (sent_to_dept, error_dept), (sent_to_user, error_user) = await EmailService.send_emails(
+                dict(recipient=recipient, subject=subject, body=body, reply_to=user_email),
+                dict(recipient=user_email, subject=confirmation_subject, body=confirmation_body),
+                deadline=settings.email_send_deadline,
+            )
+            # None means still being sent at the deadline: it may yet arrive, so it is not a failure
+            if sent_to_dept is False:
+                # Display the real error in chat
+                error_msg = await ts.translate_template(PROMPT_TEMPLATES["department_email_failed"], lang, reason=error_dept)
+                dispatcher.utter_message(text=error_msg)
+                if sent_to_user is False:
+                    return [SlotSet("complaint_id", None)]
+                # Both sends run at once, so the citizen may already hold this ID; keep it trackable
+                await record_complaint(complaint_id, user_email, state, area, dept, complaint, status="undelivered")
+                return [SlotSet("complaint_id", complaint_id)]
+
+            await record_complaint(complaint_id, user_email, state, area, dept, complaint)
+            if sent_to_user is False:
                 # Display the real error in chat
-                error_msg = ts.translate(f"⚠️ Complaint submitted, but failed to send confirmation to your email. **Reason:** {error_user}", lang)
+                error_msg = await ts.translate_template(PROMPT_TEMPLATES["confirmation_email_failed"], lang, reason=error_user)
                 dispatcher.utter_message(text=error_msg)
                 return [SlotSet("complaint_id", complaint_id)]
 
+            if sent_to_dept is None:
+                pending_msg = await ts.translate_template(PROMPT_TEMPLATES["department_email_pending"], lang, complaint_id=complaint_id)
+                dispatcher.utter_message(text=pending_msg)
+                return [SlotSet("complaint_id", complaint_id)]
+
             # If both succeeded
-            success_msg = ts.translate(
-                f"✅ Complaint registered successfully! Your Complaint ID is **{complaint_id}**.", lang
-            )
+            success_msg = await ts.translate_template(PROMPT_TEMPLATES["submit_success"], lang, complaint_id=complaint_id)
             dispatcher.utter_message(text=success_msg)
             return [SlotSet("complaint_id", complaint_id)]
 
         except Exception as e:
             logger.error(f"Error in ActionSubmitComplaint: {e}")
-            error_msg = ts.translate(f"Sorry, a critical error occurred: {e}", lang)
+            error_msg = await ts.translate_template(PROMPT_TEMPLATES["submit_error"], lang, error=e)
             dispatcher.utter_message(text=error_msg)
             return [SlotSet("complaint_id", None)]
 
@@ -298,9 +591,9 @@ class ActionAskDepartment(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         examples = get_localized_examples(lang)
-        question = TranslationService().translate(
-            "Please select department (e.g. {examples}):", lang, tracker
-        ).format(examples=examples)
+        question = await TranslationService().translate_template(
+            PROMPT_TEMPLATES["ask_department_examples"], lang, examples=examples
+        )
         dispatcher.utter_message(text=question)
         return []
 
@@ -311,7 +604,7 @@ class ActionUtterGreet(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Hello! I'm Upaay, your grievance assistant. How can I help you today?", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["greet"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -323,7 +616,7 @@ class ActionUtterAskState(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Please tell me your state:", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["ask_state"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -336,7 +629,7 @@ class ActionUtterAskArea(Action):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
         state = tracker.get_slot("state") or ""
-        msg = ts.translate(f"Which area/city in {state} are you facing the issue?", lang, tracker)
+        msg = await ts.translate_template(PROMPT_TEMPLATES["ask_area"], lang, state=state)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -348,7 +641,7 @@ class ActionUtterAskDepartment(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Select department of relevance (e.g. Water, Electricity, Land):", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["ask_department"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -360,7 +653,7 @@ class ActionUtterAskComplaintDetails(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Describe your complaint in detail (location, duration, and any relevant details):", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["ask_complaint_details"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -372,7 +665,7 @@ class ActionUtterAskConfirmation(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Would you like me to send this complaint to the respective department?", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["ask_confirmation"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -385,7 +678,7 @@ class ActionUtterThankYou(Action):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
         complaint_id = tracker.get_slot("complaint_id") or ""
-        msg = ts.translate(f"Thank you! Your complaint has been registered with ID {complaint_id}.", lang, tracker)
+        msg = await ts.translate_template(PROMPT_TEMPLATES["thank_you"], lang, complaint_id=complaint_id)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
 
@@ -397,6 +690,34 @@ class ActionUtterGoodbye(Action):
     async def run(self, dispatcher, tracker, domain):
         lang = tracker.get_slot("language") or "en"
         ts = TranslationService()
-        msg = ts.translate("Goodbye! Feel free to reach out again if you need help.", lang, tracker)
+        msg = await ts.translate(STATIC_PROMPTS["goodbye"], lang)
         dispatcher.utter_message(text=msg)
         return [SlotSet("requested_slot", None)]
+
+# --------------------------
+# Metrics
+# --------------------------
+
+def _cache_samples() -> Dict[Tuple[str, ...], float]:
+    stats = translation_cache.stats()
+    lookups = stats["hits"] + stats["misses"]
+    return {
+        ("hits",): stats["hits"],
+        ("misses",): stats["misses"],
+        ("size",): stats["size"],
+        ("hit_ratio",): stats["hits"] / lookups if lookups else 0.0,
+    }
+
+registry.register(GaugeCallback(
+    "translation_cache", "Translation cache counters and hit ratio.", _cache_samples, ["stat"]))
+registry.register(GaugeCallback(
+    "smtp_pool", "SMTP connection pool counters.", lambda: {(k,): v for k, v in smtp_pool.stats().items()}, ["stat"]))
+if email_outbox is not None:
+    registry.register(GaugeCallback(
+        "email_outbox_messages", "Outbox messages by status.",
+        lambda: {(k,): v for k, v in email_outbox.stats().items()}, ["status"]))
+
+instrument_actions(cls for cls in Action.__subclasses__() if cls.__module__ == __name__)
+
+if settings.metrics_port:
+    start_http_server(settings.metrics_port, host=settings.metrics_host)
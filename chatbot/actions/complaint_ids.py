@@ -0,0 +1,111 @@
+"""Time-ordered, collision-free complaint IDs.
+
+Each ID keeps the readable ``STA-DEP-`` prefix followed by a 13 character
+Crockford base32 encoding of a 64-bit snowflake::
+
+    | 41 bits: ms since 2024-01-01 | 13 bits: node | 10 bits: sequence |
+
+Within a process IDs are strictly increasing, even if the wall clock steps
+backwards or more than 1024 IDs are requested in one millisecond. Across
+processes uniqueness comes from the node field, which is assigned, never
+guessed: every action server owns the node range
+``COMPLAINT_ID_NODE .. COMPLAINT_ID_NODE + COMPLAINT_ID_NODE_RANGE - 1``.
+The starting process takes the first node and each worker forked from it
+the next one; running out of the range is an error rather than a reused
+node. With a single action server the defaults (node 0, range 16) are
+enough. With several replicas give each one its own, non-overlapping
+range, e.g. ``COMPLAINT_ID_NODE=0``, ``16``, ``32``...
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+EPOCH_MS = 1704067200000  # 2024-01-01T00:00:00Z
+NODE_BITS = 13
+SEQUENCE_BITS = 10
+MAX_NODE = (1 << NODE_BITS) - 1
+MAX_SEQUENCE = (1 << SEQUENCE_BITS) - 1
+
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+SUFFIX_LENGTH = 13  # ceil(64 / 5)
+
+
+def node_range() -> range:
+    """Nodes this action server may use, from COMPLAINT_ID_NODE and COMPLAINT_ID_NODE_RANGE."""
+    configured = os.getenv("COMPLAINT_ID_NODE")
+    if not configured:
+        logger.warning("COMPLAINT_ID_NODE is not set; complaint IDs are only unique with a single action server")
+    base = int(configured or 0)
+    size = int(os.getenv("COMPLAINT_ID_NODE_RANGE") or 16)
+    if size < 1 or not 0 <= base <= base + size - 1 <= MAX_NODE:
+        raise ValueError(f"COMPLAINT_ID_NODE .. COMPLAINT_ID_NODE + COMPLAINT_ID_NODE_RANGE - 1 must lie within 0-{MAX_NODE}")
+    return range(base, base + size)
+
+
+def encode_base32(value: int, length: int = SUFFIX_LENGTH) -> str:
+    chars = []
+    for _ in range(length):
+        chars.append(CROCKFORD[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
+
+
+class ComplaintIdGenerator:
+    def __init__(self, nodes: Optional[range] = None, clock: Callable[[], float] = time.time):
+        self.nodes = node_range() if nodes is None else nodes
+        if not self.nodes or self.nodes[0] < 0 or self.nodes[-1] > MAX_NODE:
+            raise ValueError(f"nodes must be a non-empty range within 0-{MAX_NODE}")
+        self.node_id: Optional[int] = self.nodes[0]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+        self._is_worker = False
+        self._forks = 0
+
+    def next_id(self) -> int:
+        if self.node_id is None:
+            raise RuntimeError(
+                f"No complaint ID node left in {self.nodes} for this worker; raise COMPLAINT_ID_NODE_RANGE"
+            )
+        with self._lock:
+            now_ms = int(self._clock() * 1000) - EPOCH_MS
+            if now_ms > self._last_ms:
+                self._last_ms = now_ms
+                self._sequence = 0
+            else:
+                # Same millisecond or the clock went backwards: stay on the logical clock
+                self._sequence += 1
+                if self._sequence > MAX_SEQUENCE:
+                    self._last_ms += 1
+                    self._sequence = 0
+            return (self._last_ms << (NODE_BITS + SEQUENCE_BITS)) | (self.node_id << SEQUENCE_BITS) | self._sequence
+
+    def generate(self, state: str, department: str) -> str:
+        return f"{state[:3].upper()}-{department[:3].upper()}-{encode_base32(self.next_id())}"
+
+    def _before_fork(self) -> None:
+        self._forks += 1
+
+    def _after_fork_in_child(self) -> None:
+        # Worker n of the starting process takes the n-th node of the range. Workers
+        # forked by a worker cannot be numbered without clashing with their siblings.
+        index = self._forks
+        self.node_id = self.nodes[index] if index < len(self.nodes) and not self._is_worker else None
+        self._is_worker = True
+        self._forks = 0
+        self._lock = threading.Lock()
+        self._last_ms = 0
+        self._sequence = 0
+
+
+complaint_ids = ComplaintIdGenerator()
+
+if hasattr(os, "register_at_fork"):
+    # A forked worker must not reuse its parent's node ID and sequence state
+    os.register_at_fork(before=complaint_ids._before_fork, after_in_child=complaint_ids._after_fork_in_child)
@@ -0,0 +1,76 @@
+"""Complaint records behind the tracking API of the Flask backends.
+
+Written through SQLAlchemy to ``COMPLAINTS_DATABASE_URL``, the same setting
+the Flask backends read them from, so the table can live in SQLite for a
+single machine or in Postgres (needs psycopg2-binary) when the backend runs
+elsewhere, e.g. on Vercel.
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, Text, create_engine, event, select
+from sqlalchemy.exc import IntegrityError
+
+# Mirrors the Flask backends' Complaint model (auth_core/models.py)
+metadata = MetaData()
+complaints = Table(
+    "complaints", metadata,
+    Column("complaint_id", String(64), primary_key=True),
+    Column("user_email", String(), nullable=False),
+    Column("state", String(100)),
+    Column("area", String(200)),
+    Column("department", String(100)),
+    Column("details", Text),
+    Column("status", String(32), nullable=False, default="registered"),
+    Column("created_at", DateTime, nullable=False),
+    Index("complaints_by_user", "user_email", "created_at", "complaint_id"),
+)
+
+
+def database_url(url: str) -> str:
+    # Heroku-style URLs use a scheme SQLAlchemy no longer accepts
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+    return url
+
+
+def _configure_sqlite(dbapi_connection, connection_record) -> None:
+    if isinstance(dbapi_connection, sqlite3.Connection):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.close()
+
+
+class ComplaintStore:
+    """Persists submitted complaints so they can be tracked by ID or by the citizen's email."""
+
+    def __init__(self, url: str, pool_size: int = 5):
+        url = database_url(url)
+        if url.startswith("sqlite"):
+            self.engine = create_engine(url, connect_args={"timeout": 30, "check_same_thread": False})
+            event.listen(self.engine, "connect", _configure_sqlite)
+        else:
+            self.engine = create_engine(url, pool_size=pool_size, pool_pre_ping=True, pool_recycle=1800)
+        metadata.create_all(self.engine)
+
+    def save(self, complaint_id: str, user_email: str, state: str, area: str, department: str, details: str,
+             status: str = "registered") -> None:
+        row = dict(
+            complaint_id=complaint_id, user_email=user_email, state=state, area=area, department=department,
+            details=details, status=status, created_at=datetime.now(timezone.utc).replace(tzinfo=None),
+        )
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(complaints.insert(), row)
+        except IntegrityError:
+            pass  # already recorded, e.g. a retried submit
+
+    def get(self, complaint_id: str) -> Optional[Dict[str, Any]]:
+        with self.engine.connect() as connection:
+            row = connection.execute(
+                select(complaints).where(complaints.c.complaint_id == complaint_id)
+            ).mappings().first()
+        return dict(row) if row else None
@@ -0,0 +1,104 @@
+"""Offline language detection for the SUPPORTED_LANGUAGES.
+
+Every supported language except Hindi/Marathi/Nepali (Devanagari) and
+Bengali/Assamese (Bengali script) has a Unicode block of its own, so the
+script alone decides. The shared scripts are split with a small list of
+high-frequency marker words and letters. ``detect_language`` returns a
+confidence so callers can fall back to a remote detector when it is low.
+"""
+
+import re
+from typing import Dict, FrozenSet, Optional, Tuple
+
+# Unicode blocks between U+0900 and U+0D7F are 128 code points wide
+_BLOCK_START = 0x0900
+_BLOCK_SCRIPTS = ("deva", "beng", "guru", "gujr", "orya", "taml", "telu", "knda", "mlym")
+
+SCRIPT_LANGUAGE: Dict[str, str] = {
+    "guru": "pa", "gujr": "gu", "orya": "or", "taml": "ta",
+    "telu": "te", "knda": "kn", "mlym": "ml", "latn": "en",
+}
+
+DEVANAGARI_MARKERS: Dict[str, FrozenSet[str]] = {
+    "hi": frozenset({
+        "है", "हैं", "और", "मैं", "मुझे", "मेरा", "मेरी", "मेरे", "नहीं", "का", "की", "के", "में",
+        "से", "यह", "वह", "रहा", "रही", "हूँ", "हूं", "नमस्ते", "शिकायत", "पानी", "बिजली", "अलविदा",
+    }),
+    "mr": frozenset({
+        "आहे", "आहेत", "आणि", "मी", "मला", "माझे", "माझा", "माझी", "नाही", "मध्ये", "ची", "चा", "चे",
+        "तक्रार", "पाणी", "वीज", "नमस्कार", "आभार", "पुन्हा", "करा", "काय",
+    }),
+    "ne": frozenset({
+        "छ", "छन्", "छैन", "हो", "म", "मेरो", "मलाई", "गर्न", "गर्नु", "भयो", "हुन्छ", "पनि",
+        "तपाईं", "तपाईंको", "गर्नुहोस्", "उजुरी",
+    }),
+}
+# Letters that are common in one language of a shared script and rare in the others
+MARATHI_LETTERS = frozenset("ळ")
+ASSAMESE_LETTERS = frozenset("ৰৱ")
+
+ENGLISH_MARKERS = frozenset({
+    "the", "a", "an", "is", "are", "i", "my", "to", "of", "in", "and", "for", "not", "no",
+    "hi", "hello", "hey", "please", "want", "have", "has", "water", "electricity", "complaint",
+    "yes", "thanks", "thank", "you", "bye", "good", "morning", "problem", "register",
+})
+
+# \w would split Indic words at their vowel signs, so split on separators instead
+_WORD_RE = re.compile(r"[^\s\d.,!?;:()\[\]\"'।॥-]+")
+
+
+def _script_of(ch: str) -> Optional[str]:
+    cp = ord(ch)
+    if cp < 0x80:
+        return "latn" if ch.isalpha() else None
+    index = (cp - _BLOCK_START) >> 7
+    if 0 <= index < len(_BLOCK_SCRIPTS):
+        return _BLOCK_SCRIPTS[index]
+    return None
+
+
+def _marker_vote(words, markers: Dict[str, FrozenSet[str]]) -> Tuple[Optional[str], float]:
+    scores = {lang: sum(1 for w in words if w in vocab) for lang, vocab in markers.items()}
+    total = sum(scores.values())
+    if not total:
+        return None, 0.0
+    lang = max(scores, key=scores.get)
+    if list(scores.values()).count(scores[lang]) > 1:
+        return None, 0.0
+    return lang, scores[lang] / total
+
+
+def detect_language(text: str) -> Tuple[Optional[str], float]:
+    """Return ``(language code, confidence in [0, 1])`` for ``text``; ``(None, 0.0)`` if unknown."""
+    counts: Dict[str, int] = {}
+    for ch in text:
+        script = _script_of(ch)
+        if script:
+            counts[script] = counts.get(script, 0) + 1
+    if not counts:
+        return None, 0.0
+
+    script = max(counts, key=counts.get)
+    share = counts[script] / sum(counts.values())
+
+    if script in ("deva", "beng", "latn"):
+        words = _WORD_RE.findall(text.lower())
+
+    if script == "deva":
+        lang, ratio = _marker_vote(words, DEVANAGARI_MARKERS)
+        if any(ch in MARATHI_LETTERS for ch in text):
+            lang, ratio = ("mr", 1.0) if lang in (None, "mr") else (lang, ratio / 2)
+        # Without markers Hindi is by far the most likely Devanagari language
+        return (lang, share * ratio) if lang else ("hi", share * 0.5)
+
+    if script == "beng":
+        if any(ch in ASSAMESE_LETTERS for ch in text):
+            return "as", share
+        return "bn", share * 0.9
+
+    if script == "latn":
+        # Romanised Indian languages also use Latin letters, so trust it only with English words
+        hits = sum(1 for w in words if w in ENGLISH_MARKERS)
+        return "en", share * (1.0 if hits else 0.6)
+
+    return SCRIPT_LANGUAGE[script], share
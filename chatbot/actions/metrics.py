@@ -0,0 +1,207 @@
+"""In-process latency and error metrics for the action server, in Prometheus text format.
+
+Recording is a dict lookup, a bisect and a few additions under a per-metric
+lock (about a microsecond), so it is safe on every action run and dependency
+call. ``start_http_server`` serves ``/metrics`` from a daemon thread; values
+that already live elsewhere (cache, SMTP pool and outbox stats) are read
+from callbacks at scrape time instead of being tracked twice.
+"""
+
+import bisect
+import functools
+import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[LabelValues, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        lines += [f"{self.name}{_format_labels(self.labelnames, labels)} {value}" for labels, value in values]
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: [count per bucket (last one is +Inf), sum]
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            series[0][index] += 1
+            series[1][0] += value
+
+    def collect(self) -> List[str]:
+        with self._lock:
+            series = [(labels, list(counts), total[0]) for labels, (counts, total) in self._series.items()]
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = 'le="+Inf"' if bound == float("inf") else f'le="{bound!r}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class GaugeCallback:
+    """Gauge whose samples are read at scrape time: ``func`` returns {label values: value}."""
+
+    def __init__(self, name: str, documentation: str, func: Callable[[], Dict[LabelValues, float]],
+                 labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.func = func
+
+    def collect(self) -> List[str]:
+        try:
+            samples = self.func()
+        except Exception as e:
+            logger.warning(f"Metric {self.name} could not be collected: {e}")
+            return []
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        lines += [f"{self.name}{_format_labels(self.labelnames, labels)} {value}" for labels, value in samples.items()]
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[object] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+ACTION_LATENCY = registry.register(Histogram(
+    "action_run_seconds", "Latency of custom action runs.", ["action"]))
+ACTION_ERRORS = registry.register(Counter(
+    "action_errors_total", "Custom action runs that raised.", ["action"]))
+DEPENDENCY_LATENCY = registry.register(Histogram(
+    "dependency_call_seconds", "Latency of calls to translation, SMTP, routing and storage.", ["dependency"]))
+DEPENDENCY_ERRORS = registry.register(Counter(
+    "dependency_errors_total", "Failed calls to translation, SMTP, routing and storage.", ["dependency"]))
+
+
+class track:
+    """``with track("smtp") as call:`` times a dependency call; raising, or ``call.failed = True``, counts an error."""
+
+    __slots__ = ("dependency", "start", "failed")
+
+    def __init__(self, dependency: str):
+        self.dependency = dependency
+        self.failed = False
+
+    def __enter__(self) -> "track":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        DEPENDENCY_LATENCY.observe(time.perf_counter() - self.start, self.dependency)
+        if exc_type is not None or self.failed:
+            DEPENDENCY_ERRORS.inc(self.dependency)
+
+
+def instrument_actions(actions: Iterable[type]) -> None:
+    """Wrap each action class's async ``run`` with latency and error recording."""
+    for action in actions:
+        run = action.run
+        if getattr(run, "_instrumented", False):
+            continue
+
+        @functools.wraps(run)
+        async def timed_run(self, *args, _run=run, **kwargs):
+            name = self.name()
+            start = time.perf_counter()
+            try:
+                return await _run(self, *args, **kwargs)
+            except Exception:
+                ACTION_ERRORS.inc(name)
+                raise
+            finally:
+                ACTION_LATENCY.observe(time.perf_counter() - start, name)
+
+        timed_run._instrumented = True
+        action.run = timed_run
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.split("?", 1)[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = registry.render().encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_http_server(port: int, host: str = "127.0.0.1") -> Optional[ThreadingHTTPServer]:
+    try:
+        server = ThreadingHTTPServer((host, port), _MetricsHandler)
+    except OSError as e:
+        # e.g. a second action server process on the same host
+        logger.warning(f"Metrics endpoint not started on port {port}: {e}")
+        return None
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    logger.info(f"Serving metrics on http://{host}:{port}/metrics")
+    return server
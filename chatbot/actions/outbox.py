@@ -0,0 +1,210 @@
+import logging
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+SendFunc = Callable[..., Tuple[bool, Optional[str]]]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    dedupe_key TEXT NOT NULL UNIQUE,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    reply_to TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    sent_at REAL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (status, next_attempt_at);
+CREATE TABLE IF NOT EXISTS outbox_dead (
+    id INTEGER PRIMARY KEY,
+    dedupe_key TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    body TEXT NOT NULL,
+    reply_to TEXT,
+    attempts INTEGER NOT NULL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    failed_at REAL NOT NULL
+);
+"""
+
+
+@contextmanager
+def _transaction(db: sqlite3.Connection):
+    db.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        db.execute("ROLLBACK")
+        raise
+    db.execute("COMMIT")
+
+
+class EmailOutbox:
+    """SQLite-backed queue of outbound emails drained by background worker threads.
+
+    ``enqueue`` is idempotent per ``dedupe_key``. Failed sends are retried with
+    exponential backoff and jitter; after ``max_attempts`` the message moves to
+    the ``outbox_dead`` table. A claimed message that is not finished within
+    ``lease`` seconds (e.g. the process died mid-send) becomes due again.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        send: SendFunc,
+        workers: int = 2,
+        max_attempts: int = 8,
+        base_delay: float = 5.0,
+        max_delay: float = 900.0,
+        lease: float = 300.0,
+        poll_interval: float = 1.0,
+        keep_sent_for: float = 7 * 24 * 3600,
+    ):
+        self.path = Path(path)
+        self.send = send
+        self.workers = max(1, workers)
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.lease = lease
+        self.poll_interval = poll_interval
+        self.keep_sent_for = keep_sent_for
+        self._threads: List[threading.Thread] = []
+        self._stopped = threading.Event()
+        self._wakeup = threading.Event()
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = self._connect()
+        self._db.executescript(SCHEMA)
+
+    # --------------------------
+    # Producer side
+    # --------------------------
+
+    def enqueue(self, dedupe_key: str, recipient: str, subject: str, body: str, reply_to: Optional[str] = None) -> bool:
+        """Persist a message for delivery; returns False if ``dedupe_key`` was already queued."""
+        now = time.time()
+        with self._lock:
+            cursor = self._db.execute(
+                "INSERT OR IGNORE INTO outbox (dedupe_key, recipient, subject, body, reply_to, next_attempt_at, created_at)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (dedupe_key, recipient, subject, body, reply_to, now, now),
+            )
+        self._wakeup.set()
+        return cursor.rowcount == 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts = dict(self._db.execute("SELECT status, COUNT(*) FROM outbox GROUP BY status").fetchall())
+            dead = self._db.execute("SELECT COUNT(*) FROM outbox_dead").fetchone()[0]
+        return {"pending": counts.get("pending", 0), "sent": counts.get("sent", 0), "dead": dead}
+
+    # --------------------------
+    # Worker pool
+    # --------------------------
+
+    def start(self) -> None:
+        if self._threads:
+            return
+        self._stopped.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"email-outbox-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self) -> None:
+        db = self._connect()
+        last_prune = 0.0
+        while not self._stopped.is_set():
+            try:
+                job = self._claim(db)
+                if job is None:
+                    if time.time() - last_prune > 3600:
+                        self._prune(db)
+                        last_prune = time.time()
+                    self._wakeup.wait(self.poll_interval)
+                    self._wakeup.clear()
+                    continue
+                self._deliver(db, job)
+            except sqlite3.Error as e:
+                logger.error(f"Email outbox worker error: {e}")
+                self._stopped.wait(self.poll_interval)
+        db.close()
+
+    def _claim(self, db: sqlite3.Connection) -> Optional[tuple]:
+        now = time.time()
+        with _transaction(db):
+            job = db.execute(
+                "SELECT id, dedupe_key, recipient, subject, body, reply_to, attempts FROM outbox"
+                " WHERE status = 'pending' AND next_attempt_at <= ? AND (claimed_until IS NULL OR claimed_until < ?)"
+                " ORDER BY next_attempt_at LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if job is not None:
+                db.execute("UPDATE outbox SET claimed_until = ? WHERE id = ?", (now + self.lease, job[0]))
+        return job
+
+    def _deliver(self, db: sqlite3.Connection, job: tuple) -> None:
+        job_id, dedupe_key, recipient, subject, body, reply_to, attempts = job
+        try:
+            ok, error = self.send(recipient, subject, body, reply_to=reply_to)
+        except Exception as e:
+            ok, error = False, str(e)
+        attempts += 1
+        now = time.time()
+
+        if ok:
+            db.execute(
+                "UPDATE outbox SET status = 'sent', attempts = ?, sent_at = ?, claimed_until = NULL, last_error = NULL"
+                " WHERE id = ?",
+                (attempts, now, job_id),
+            )
+            logger.info(f"Outbox delivered {dedupe_key} to {recipient} (attempt {attempts})")
+        elif attempts >= self.max_attempts:
+            with _transaction(db):
+                db.execute(
+                    "INSERT OR REPLACE INTO outbox_dead (id, dedupe_key, recipient, subject, body, reply_to, attempts, last_error, created_at, failed_at)"
+                    " SELECT id, dedupe_key, recipient, subject, body, reply_to, ?, ?, created_at, ? FROM outbox WHERE id = ?",
+                    (attempts, error, now, job_id),
+                )
+                db.execute("DELETE FROM outbox WHERE id = ?", (job_id,))
+            logger.error(f"Outbox gave up on {dedupe_key} after {attempts} attempts: {error}")
+        else:
+            delay = min(self.max_delay, self.base_delay * 2 ** (attempts - 1)) * random.uniform(0.5, 1.0)
+            db.execute(
+                "UPDATE outbox SET attempts = ?, next_attempt_at = ?, claimed_until = NULL, last_error = ? WHERE id = ?",
+                (attempts, now + delay, error, job_id),
+            )
+            logger.warning(f"Outbox retrying {dedupe_key} in {delay:.0f}s (attempt {attempts}): {error}")
+
+    def _prune(self, db: sqlite3.Connection) -> None:
+        db.execute("DELETE FROM outbox WHERE status = 'sent' AND sent_at < ?", (time.time() - self.keep_sent_for,))
+
+    def _connect(self) -> sqlite3.Connection:
+        db = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        return db
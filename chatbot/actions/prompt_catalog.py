@@ -0,0 +1,114 @@
+"""Precompiled translations of the static bot prompts and prompt templates.
+
+Build the catalog once, offline, from the ``chatbot`` directory::
+
+    python -m actions.prompt_catalog
+
+The resulting ``config/prompt_catalog.json`` is loaded once when the action
+server starts, so static prompts and template skeletons are served with a
+dict lookup instead of a live googletrans round-trip. The action server
+image builds it with ``--strict`` and sets ``PROMPT_CATALOG_REQUIRED``, so a
+missing or incomplete catalog fails the build or the start instead of
+silently falling back to live translation.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .prompts import PROMPT_TEMPLATES, STATIC_PROMPTS, SUPPORTED_LANGUAGES, protect_placeholders, restore_placeholders
+
+logger = logging.getLogger(__name__)
+
+CATALOG_PATH = Path(__file__).parent / "config" / "prompt_catalog.json"
+
+
+class PromptCatalog:
+    """Read-only mapping of ``dest_lang -> {english source: translation}``."""
+
+    def __init__(self, entries: Optional[Dict[str, Dict[str, str]]] = None):
+        self.entries = entries or {}
+
+    @classmethod
+    def load(cls, path: Path = CATALOG_PATH, required: bool = False) -> "PromptCatalog":
+        try:
+            with open(path, encoding="utf-8") as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            if required:
+                raise RuntimeError(
+                    f"Prompt catalog {path} could not be loaded ({e}); build it with python -m actions.prompt_catalog"
+                ) from e
+            logger.warning(f"No usable prompt catalog at {path} ({e}); every static prompt will be translated live")
+            return cls()
+        logger.info(f"Loaded prompt catalog with {sum(len(v) for v in entries.values())} translations")
+        return cls(entries)
+
+    def get(self, dest_lang: str, text: str) -> Optional[str]:
+        return self.entries.get(dest_lang, {}).get(text)
+
+    def missing(self, sources: Iterable[str], languages: Iterable[str]) -> Dict[str, int]:
+        """Number of ``sources`` without a translation, per language."""
+        sources = list(sources)
+        missing = {}
+        for lang in languages:
+            translated = self.entries.get(lang, {})
+            count = sum(source not in translated for source in sources)
+            if lang != "en" and count:
+                missing[lang] = count
+        return missing
+
+    def save(self, path: Path = CATALOG_PATH) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.entries, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def build_catalog(sources: Iterable[str], languages: Iterable[str], existing: Optional[PromptCatalog] = None) -> PromptCatalog:
+    from googletrans import Translator
+
+    translator = Translator()
+    previous = existing.entries if existing else {}
+    entries: Dict[str, Dict[str, str]] = {}
+    for lang in languages:
+        if lang == "en":
+            continue
+        translated = entries.setdefault(lang, {})
+        for source in sources:
+            protected, names = protect_placeholders(source)
+            try:
+                result = restore_placeholders(translator.translate(protected, src="en", dest=lang).text, names)
+                if result is None:
+                    raise ValueError(f"placeholders {names} lost in translation")
+                translated[source] = result
+            except Exception as e:
+                logger.error(f"Catalog translation failed ({lang}): {e}")
+                if source in previous.get(lang, {}):
+                    translated[source] = previous[lang][source]
+    return PromptCatalog(entries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Pre-translate bot prompts into every supported language.")
+    parser.add_argument("--output", type=Path, default=CATALOG_PATH)
+    parser.add_argument("--languages", nargs="*", default=list(SUPPORTED_LANGUAGES))
+    parser.add_argument("--strict", action="store_true", help="exit with an error if any prompt is left untranslated")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    sources = list(STATIC_PROMPTS.values()) + list(PROMPT_TEMPLATES.values())
+    catalog = build_catalog(sources, args.languages, PromptCatalog.load(args.output))
+    catalog.save(args.output)
+    logger.info(f"Wrote {sum(len(v) for v in catalog.entries.values())} translations to {args.output}")
+    missing = catalog.missing(sources, args.languages)
+    if missing:
+        logger.error(f"Untranslated prompts per language: {missing}")
+        if args.strict:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+SUPPORTED_LANGUAGES = {
+    "en": "English", "hi": "Hindi", "mr": "Marathi", "ta": "Tamil", "te": "Telugu",
+    "kn": "Kannada", "bn": "Bengali", "gu": "Gujarati", "pa": "Punjabi",
+    "or": "Odia", "ml": "Malayalam", "as": "Assamese", "ne": "Nepali"
+}
+
+# Fixed bot prompts. These never contain user data, so they are translated
+# ahead of time into every supported language by ``prompt_catalog``.
+STATIC_PROMPTS: Dict[str, str] = {
+    "greet": "Hello! I'm Upaay, your grievance assistant. How can I help you today?",
+    "ask_state": "Please tell me your state:",
+    "ask_department": "Select department of relevance (e.g. Water, Electricity, Land):",
+    "ask_complaint_details": "Describe your complaint in detail (location, duration, and any relevant details):",
+    "ask_confirmation": "Would you like me to send this complaint to the respective department?",
+    "goodbye": "Goodbye! Feel free to reach out again if you need help.",
+    "submit_failed": "⚠️ Complaint submission failed!",
+}
+
+# Prompts that embed slot values. The skeleton is translated once per language
+# with its placeholders protected, and the values are substituted afterwards.
+DRAFT_EMAIL_TEMPLATE = (
+    "Subject: Grievance Submission Regarding the {department} Department in {area}, {state}\n\n"
+    "Dear Sir/Madam,\n\n"
+    "I am writing to formally raise a concern regarding an issue related to the {department} department in {area}, {state}.\n\n"
+    "Details of the issue:\n{complaint_details}\n\n"
+    "I kindly request that this matter be addressed at the earliest convenience.\n\n"
+    "Thank you for your attention to this issue.\n\n"
+    "Sincerely,\nA Concerned Citizen"
+)
+
+PROMPT_TEMPLATES: Dict[str, str] = {
+    "ask_area": "Which area/city in {state} are you facing the issue?",
+    "ask_department_examples": "Please select department (e.g. {examples}):",
+    "draft": "Here is your draft email:\n\n" + DRAFT_EMAIL_TEMPLATE,
+    "department_email_failed": "⚠️ Failed to send email to the department. **Reason:** {reason}",
+    "department_email_pending": "✅ Complaint registered with ID **{complaint_id}**. The email to the department is taking longer than usual and is still being sent.",
+    "confirmation_email_failed": "⚠️ Complaint submitted, but failed to send confirmation to your email. **Reason:** {reason}",
+    "submit_success": "✅ Complaint registered successfully! Your Complaint ID is **{complaint_id}**.",
+    "submit_error": "Sorry, a critical error occurred: {error}",
+    "thank_you": "Thank you! Your complaint has been registered with ID {complaint_id}.",
+}
+
+PLACEHOLDER_RE = re.compile(r"\{(\w+)\}")
+# Numeric tokens survive machine translation far better than named ones,
+# which tend to get translated along with the surrounding text.
+PROTECTED_TOKEN_RE = re.compile(r"\{\s*(\d+)\s*\}")
+
+
+def protect_placeholders(template: str) -> Tuple[str, List[str]]:
+    names: List[str] = []
+
+    def _protect(match):
+        if match.group(1) not in names:
+            names.append(match.group(1))
+        return "{%d}" % names.index(match.group(1))
+
+    return PLACEHOLDER_RE.sub(_protect, template), names
+
+
+def restore_placeholders(translated: str, names: List[str]) -> Optional[str]:
+    """Map protected tokens back to their names, or return None if the translation mangled them."""
+    seen = set()
+
+    def _restore(match):
+        index = int(match.group(1))
+        if index >= len(names):
+            raise ValueError(f"Unknown placeholder token {match.group(0)}")
+        seen.add(index)
+        return "{%s}" % names[index]
+
+    try:
+        restored = PROTECTED_TOKEN_RE.sub(_restore, translated)
+        # Rejects stray braces the translator may have introduced
+        restored.format(**{name: "" for name in names})
+    except (ValueError, IndexError, KeyError):
+        return None
+    if len(seen) != len(names):
+        return None
+    return restored
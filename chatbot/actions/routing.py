@@ -0,0 +1,154 @@
+"""Department routing table compiled from ``config/dept_emails.yml``.
+
+The YAML maps ``state -> department -> email``. A state may also carry a
+``districts`` mapping with the same shape, and the optional top-level
+``aliases`` section maps alternative spellings (abbreviations, other
+scripts, synonyms) onto canonical state, district and department keys::
+
+    aliases:
+      states: {nct of delhi: delhi}
+      departments: {bijli: electricity}
+    delhi:
+      water: water@example.org
+      districts:
+        south delhi:
+          water: south-water@example.org
+    default:
+      default: grievances@example.org
+
+Everything is flattened into one dict keyed by ``(state, district, department)``
+with interned strings, so lookups are a handful of O(1) probes and the
+index stays small even with tens of thousands of entries. The file is
+re-read when its modification time changes.
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT = "default"
+RESERVED_KEYS = ("aliases", "districts")
+
+_SEPARATORS_RE = re.compile(r"[\s_\-./,]+")
+_NOISE_WORDS_RE = re.compile(r"\b(department|dept|board)\b")
+
+RouteKey = Tuple[str, str, str]
+
+
+@lru_cache(maxsize=8192)
+def routing_key(text: Optional[str]) -> str:
+    """Canonical form of a state, district or department name."""
+    if not text:
+        return ""
+    text = _NOISE_WORDS_RE.sub(" ", str(text).lower())
+    return sys.intern(_SEPARATORS_RE.sub("_", text).strip("_"))
+
+
+class _RoutingIndex:
+    __slots__ = ("routes", "state_aliases", "district_aliases", "department_aliases")
+
+    def __init__(self, config: Dict[str, Any]):
+        self.routes: Dict[RouteKey, str] = {}
+        aliases = config.get("aliases") or {}
+        self.state_aliases = self._aliases(aliases.get("states"))
+        self.district_aliases = self._aliases(aliases.get("districts"))
+        self.department_aliases = self._aliases(aliases.get("departments"))
+
+        for state, departments in config.items():
+            if state in RESERVED_KEYS or not isinstance(departments, dict):
+                continue
+            state_key = routing_key(state)
+            self._add(state_key, "", departments)
+            for district, district_departments in (departments.get("districts") or {}).items():
+                self._add(state_key, routing_key(district), district_departments or {})
+
+    def _add(self, state: str, district: str, departments: Dict[str, Any]) -> None:
+        for department, email in departments.items():
+            if department in RESERVED_KEYS or not email:
+                continue
+            self.routes[(state, district, routing_key(department))] = sys.intern(str(email).strip())
+
+    @staticmethod
+    def _aliases(mapping: Optional[Dict[str, str]]) -> Dict[str, str]:
+        return {routing_key(alias): routing_key(target) for alias, target in (mapping or {}).items()}
+
+
+class DepartmentRouter:
+    def __init__(self, path: Path, reload_interval: float = 5.0):
+        self.path = Path(path)
+        self.reload_interval = reload_interval
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._checked_at = 0.0
+        self._index = _RoutingIndex({})
+        self.reload()
+
+    def lookup(self, state: Optional[str], department: Optional[str], district: Optional[str] = None) -> Optional[str]:
+        self._maybe_reload()
+        index = self._index
+        state_key = routing_key(state)
+        state_key = index.state_aliases.get(state_key, state_key)
+        district_key = routing_key(district)
+        district_key = index.district_aliases.get(district_key, district_key)
+        department_key = routing_key(department)
+        department_key = index.department_aliases.get(department_key, department_key)
+
+        routes = index.routes
+        candidates = (
+            (state_key, district_key, department_key),
+            (state_key, "", department_key),
+            (state_key, district_key, DEFAULT),
+            (state_key, "", DEFAULT),
+            (DEFAULT, "", DEFAULT),
+        )
+        for key in candidates:
+            email = routes.get(key)
+            if email:
+                return email
+        return None
+
+    def canonical_department(self, department: Optional[str]) -> str:
+        key = routing_key(department)
+        return self._index.department_aliases.get(key, key)
+
+    def __len__(self) -> int:
+        return len(self._index.routes)
+
+    def reload(self) -> bool:
+        """Rebuild the index from disk; on error the previous index stays in place."""
+        with self._lock:
+            try:
+                stat = os.stat(self.path)
+                with open(self.path, encoding="utf-8") as f:
+                    config = yaml.safe_load(f) or {}
+                index = _RoutingIndex(config)
+            except (OSError, yaml.YAMLError, AttributeError, TypeError) as e:
+                logger.error(f"Failed to load department routing from {self.path}: {e}")
+                return False
+            self._index = index
+            self._signature = (stat.st_mtime_ns, stat.st_size)
+            self._checked_at = time.monotonic()
+        logger.info(f"Loaded {len(index.routes)} department routes from {self.path}")
+        return True
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return
+        if (stat.st_mtime_ns, stat.st_size) != self._signature:
+            self.reload()
@@ -0,0 +1,190 @@
+import logging
+import smtplib
+import threading
+import time
+from email.message import EmailMessage
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SMTPPoolTimeout(Exception):
+    pass
+
+
+class _PooledConnection:
+    def __init__(self, smtp: smtplib.SMTP):
+        self.smtp = smtp
+        self.created_at = time.monotonic()
+        self.last_used = self.created_at
+
+    def age(self, now: float) -> float:
+        return now - self.created_at
+
+    def idle(self, now: float) -> float:
+        return now - self.last_used
+
+
+class SMTPConnectionPool:
+    """Keeps authenticated SMTP sessions alive between sends.
+
+    At most ``max_size`` sessions exist at once; callers beyond that wait up to
+    ``timeout`` seconds for one to be returned. Idle sessions are probed with
+    NOOP every ``keepalive_interval`` seconds by a background thread, and any
+    session that fails the probe or is older than ``max_age`` is replaced.
+    Point it at a local ``aiosmtpd`` server with ``starttls=False`` and no
+    username to test without a real mail provider.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str = "",
+        password: str = "",
+        starttls: bool = True,
+        max_size: int = 4,
+        timeout: float = 30.0,
+        keepalive_interval: float = 60.0,
+        max_age: float = 600.0,
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+        self.keepalive_interval = keepalive_interval
+        self.max_age = max_age
+        self._slots = threading.BoundedSemaphore(max(1, max_size))
+        self._idle: List[_PooledConnection] = []
+        self._lock = threading.Lock()
+        self._keepalive: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self.connects = 0
+        self.reuses = 0
+        self.discards = 0
+
+    # --------------------------
+    # Public API
+    # --------------------------
+
+    def send_message(self, msg: EmailMessage) -> None:
+        if not self._slots.acquire(timeout=self.timeout):
+            raise SMTPPoolTimeout(f"No SMTP connection available within {self.timeout}s")
+        try:
+            conn = self._checkout()
+            try:
+                conn.smtp.send_message(msg)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped a pooled session between our probe and the send
+                self._discard(conn)
+                conn = self._connect()
+                try:
+                    conn.smtp.send_message(msg)
+                except Exception:
+                    self._discard(conn)
+                    raise
+            except Exception:
+                self._discard(conn)
+                raise
+            self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    def close(self) -> None:
+        self._closed.set()
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            self._discard(conn)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            idle = len(self._idle)
+        return {"idle": idle, "connects": self.connects, "reuses": self.reuses, "discards": self.discards}
+
+    # --------------------------
+    # Connection lifecycle
+    # --------------------------
+
+    def _connect(self) -> _PooledConnection:
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.starttls:
+                smtp.starttls()
+            if self.username:
+                smtp.login(self.username, self.password)
+        except Exception:
+            smtp.close()
+            raise
+        self.connects += 1
+        self._start_keepalive()
+        return _PooledConnection(smtp)
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                conn = self._idle.pop()
+            now = time.monotonic()
+            if conn.age(now) > self.max_age:
+                self._discard(conn)
+                continue
+            if conn.idle(now) > self.keepalive_interval and not self._is_alive(conn):
+                self._discard(conn)
+                continue
+            self.reuses += 1
+            return conn
+        return self._connect()
+
+    def _checkin(self, conn: _PooledConnection) -> None:
+        conn.last_used = time.monotonic()
+        if self._closed.is_set() or conn.age(conn.last_used) > self.max_age:
+            self._discard(conn)
+            return
+        with self._lock:
+            self._idle.append(conn)
+
+    def _discard(self, conn: _PooledConnection) -> None:
+        self.discards += 1
+        try:
+            conn.smtp.quit()
+        except Exception:
+            conn.smtp.close()
+
+    @staticmethod
+    def _is_alive(conn: _PooledConnection) -> bool:
+        try:
+            return conn.smtp.noop()[0] == 250
+        except Exception:
+            return False
+
+    # --------------------------
+    # Keepalive
+    # --------------------------
+
+    def _start_keepalive(self) -> None:
+        if self._keepalive is not None or self.keepalive_interval <= 0:
+            return
+        with self._lock:
+            if self._keepalive is None:
+                self._keepalive = threading.Thread(target=self._keepalive_loop, name="smtp-keepalive", daemon=True)
+                self._keepalive.start()
+
+    def _keepalive_loop(self) -> None:
+        while not self._closed.wait(self.keepalive_interval):
+            with self._lock:
+                idle, self._idle = self._idle, []
+            now = time.monotonic()
+            alive = []
+            for conn in idle:
+                if conn.age(now) > self.max_age or not self._is_alive(conn):
+                    self._discard(conn)
+                else:
+                    alive.append(conn)
+            with self._lock:
+                self._idle.extend(alive)
+            if idle:
+                logger.debug(f"SMTP keepalive: {len(alive)}/{len(idle)} idle sessions alive")
@@ -0,0 +1,170 @@
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+class TranslationCache:
+    """Process-wide LRU cache of translations with a TTL and optional SQLite persistence.
+
+    Entries are keyed by ``(dest_lang, text)`` where ``text`` is the final rendered
+    source string. When ``path`` is given every write goes through to an on-disk
+    SQLite table so translations survive action server restarts.
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: float = 7 * 24 * 3600, path: Optional[str] = None):
+        self.max_size = max(1, int(max_size))
+        self.ttl = float(ttl)
+        self._entries: "OrderedDict[CacheKey, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if path:
+            self._open(Path(path))
+
+    # --------------------------
+    # Public API
+    # --------------------------
+
+    def get(self, dest_lang: str, text: str) -> Optional[str]:
+        key = (dest_lang, text)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, stored_at = entry
+                if self._expired(stored_at, now):
+                    del self._entries[key]
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+
+            entry = self._load(key, now)
+            if entry is not None:
+                self._insert(key, entry)
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+            return None
+
+    def set(self, dest_lang: str, text: str, value: str) -> None:
+        key = (dest_lang, text)
+        entry = (value, time.time())
+        with self._lock:
+            self._insert(key, entry)
+            self._store(key, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._execute("DELETE FROM translations")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    # --------------------------
+    # In-memory LRU
+    # --------------------------
+
+    def _expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - stored_at > self.ttl
+
+    def _insert(self, key: CacheKey, entry: Tuple[str, float]) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # --------------------------
+    # SQLite persistence
+    # --------------------------
+
+    def _open(self, path: Path) -> None:
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS translations ("
+                " dest_lang TEXT NOT NULL,"
+                " source TEXT NOT NULL,"
+                " result TEXT NOT NULL,"
+                " stored_at REAL NOT NULL,"
+                " PRIMARY KEY (dest_lang, source))"
+            )
+            self._prune()
+            self._warm()
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache persistence disabled ({path}): {e}")
+            self._db = None
+
+    def _prune(self) -> None:
+        if self.ttl > 0:
+            self._execute("DELETE FROM translations WHERE stored_at < ?", (time.time() - self.ttl,))
+        # Keep the on-disk store bounded to the same size as the in-memory LRU
+        self._execute(
+            "DELETE FROM translations WHERE rowid NOT IN "
+            "(SELECT rowid FROM translations ORDER BY stored_at DESC LIMIT ?)",
+            (self.max_size,),
+        )
+
+    def _warm(self) -> None:
+        rows = self._db.execute(
+            "SELECT dest_lang, source, result, stored_at FROM translations ORDER BY stored_at ASC"
+        ).fetchall()
+        for dest_lang, source, result, stored_at in rows:
+            self._insert((dest_lang, source), (result, stored_at))
+        logger.info(f"Translation cache warmed with {len(rows)} persisted entries")
+
+    def _load(self, key: CacheKey, now: float) -> Optional[Tuple[str, float]]:
+        if self._db is None:
+            return None
+        row = self._execute(
+            "SELECT result, stored_at FROM translations WHERE dest_lang = ? AND source = ?", key
+        )
+        row = row.fetchone() if row is not None else None
+        if row is None or self._expired(row[1], now):
+            return None
+        return row[0], row[1]
+
+    def _store(self, key: CacheKey, entry: Tuple[str, float]) -> None:
+        if self._db is None:
+            return
+        self._execute(
+            "INSERT OR REPLACE INTO translations (dest_lang, source, result, stored_at) VALUES (?, ?, ?, ?)",
+            (key[0], key[1], entry[0], entry[1]),
+        )
+
+    def _execute(self, sql: str, params: tuple = ()) -> Optional[sqlite3.Cursor]:
+        try:
+            return self._db.execute(sql, params)
+        except sqlite3.Error as e:
+            logger.error(f"Translation cache persistence error: {e}")
+            return None
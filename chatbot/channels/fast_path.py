@@ -0,0 +1,174 @@
+"""REST input channel that answers known state and department names without NLU.
+
+Most replies to "Please tell me your state" and the department prompt are a
+bare name: "Delhi", "water supply", "पानी". Such a reply is rewritten into
+Rasa's intent shortcut, e.g. ``/provide_state{"state": "Delhi"}``, which
+Rasa resolves directly instead of running the NLU pipeline. The entity value
+is the user's own text, as the entity extractor would have produced it, so
+slot filling and ``normalize_department`` downstream see the same values.
+
+The names come from ``actions/config/dept_emails.yml`` (states, departments
+and their aliases) and the state, department and area entities annotated
+in ``data/nlu.yml``. Both are indexed by ``routing_key``, so case, spacing
+and a trailing "department" or "board" do not matter. The shortcut only
+applies when all of these hold:
+
+* the whole reply is a name ("water supply in Delhi is irregular" is
+  complaint details);
+* the bot's last action asked for that kind of name (a bare "power" given
+  as complaint details is not a department);
+* the name is not also used as another entity ("New Delhi" is an area as
+  well as a state alias).
+
+Everything else goes through unchanged. The last action is read from the
+tracker store, and only for replies that are a known name.
+
+Enabled in ``credentials.yml``; the channel keeps the name ``rest``, so the
+webhook stays at ``/webhooks/rest/webhook``.
+"""
+
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple
+
+import yaml
+from rasa.core.channels.rest import RestInput
+from rasa.shared.core.constants import ACTION_LISTEN_NAME
+from rasa.shared.core.events import ActionExecuted
+from sanic.request import Request
+
+from actions.routing import DEFAULT, RESERVED_KEYS, routing_key
+
+logger = logging.getLogger(__name__)
+
+CHATBOT_DIR = Path(__file__).resolve().parent.parent
+ROUTING_PATH = CHATBOT_DIR / "actions" / "config" / "dept_emails.yml"
+NLU_PATH = CHATBOT_DIR / "data" / "nlu.yml"
+
+# Entity -> intent the reply is classified as
+ENTITY_INTENTS = {"state": "provide_state", "department": "provide_department"}
+# Only indexed so that names shared with an area are left to NLU
+OTHER_ENTITIES = ("area",)
+
+# Bot action that asked the question -> entity the reply is expected to be
+PROMPT_ENTITIES = {
+    "action_utter_ask_state": "state",
+    "action_utter_ask_department": "department",
+    "action_ask_department": "department",
+}
+
+# Replies longer than any name are never looked up
+MAX_REPLY_LENGTH = 64
+
+_ENTITY_RE = re.compile(r"\[([^\]]+)\]\((\w+)\)")
+
+
+class SlotValueIndex:
+    """Maps the routing key of a known name to the entity it is a value of."""
+
+    def __init__(self, names: Iterable[Tuple[str, str]]):
+        self.entities: Dict[str, str] = {}
+        ambiguous = set()
+        for name, entity in names:
+            key = routing_key(name)
+            if not key or key == DEFAULT:
+                continue
+            if self.entities.setdefault(key, entity) != entity:
+                ambiguous.add(key)
+        for key in ambiguous:
+            del self.entities[key]
+
+    @classmethod
+    def from_files(cls, routing_path: Path = ROUTING_PATH, nlu_path: Path = NLU_PATH) -> "SlotValueIndex":
+        names = []
+        for path, reader in ((routing_path, _routing_names), (nlu_path, _nlu_names)):
+            try:
+                with open(path, encoding="utf-8") as f:
+                    names.extend(reader(yaml.safe_load(f) or {}))
+            except (OSError, yaml.YAMLError, AttributeError, TypeError) as e:
+                logger.error(f"Failed to read slot values from {path}: {e}")
+        return cls(names)
+
+    def entity(self, text: Optional[str]) -> Optional[str]:
+        """Entity the whole reply ``text`` is a known value of, if any."""
+        if not text or len(text) > MAX_REPLY_LENGTH or text.startswith("/"):
+            return None
+        return self.entities.get(routing_key(text))
+
+    def match(self, text: Optional[str], expected: Optional[str]) -> Optional[str]:
+        """Intent shortcut for ``text`` if the whole reply is a known ``expected`` name, else None."""
+        entity = self.entity(text)
+        if entity is None or entity != expected or entity not in ENTITY_INTENTS:
+            return None
+        value = json.dumps({entity: text.strip()}, ensure_ascii=False)
+        return f"/{ENTITY_INTENTS[entity]}{value}"
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+
+def _routing_names(config: Dict) -> Iterable[Tuple[str, str]]:
+    aliases = config.get("aliases") or {}
+    for alias, state in (aliases.get("states") or {}).items():
+        yield alias, "state"
+        yield state, "state"
+    for alias, department in (aliases.get("departments") or {}).items():
+        yield alias, "department"
+        yield department, "department"
+    for state, departments in config.items():
+        if state in RESERVED_KEYS or not isinstance(departments, dict):
+            continue
+        yield state, "state"
+        for department in departments:
+            if department not in RESERVED_KEYS:
+                yield department, "department"
+
+
+def _nlu_names(data: Dict) -> Iterable[Tuple[str, str]]:
+    for item in data.get("nlu") or []:
+        for value, entity in _ENTITY_RE.findall(item.get("examples") or ""):
+            if entity in ENTITY_INTENTS or entity in OTHER_ENTITIES:
+                yield value, entity
+
+
+class FastPathInput(RestInput):
+    """``rest`` channel that sends known state and department names straight to their intent."""
+
+    @classmethod
+    def name(cls) -> str:
+        return "rest"
+
+    def __init__(self, index: Optional[SlotValueIndex] = None):
+        self.index = index if index is not None else SlotValueIndex.from_files()
+        logger.info(f"Fast path enabled for {len(self.index)} names")
+
+    async def _extract_sender(self, req: Request) -> Optional[str]:
+        # RestInput reads the sender before the message; this is the async hook
+        # where the conversation can be looked up
+        sender_id = await super()._extract_sender(req)
+        text = super()._extract_message(req)
+        req.ctx.fast_path_message = None
+        if self.index.entity(text) in ENTITY_INTENTS:
+            expected = await self._expected_entity(req.app.ctx.agent, sender_id)
+            req.ctx.fast_path_message = self.index.match(text, expected)
+        return sender_id
+
+    def _extract_message(self, req: Request) -> Optional[str]:
+        return getattr(req.ctx, "fast_path_message", None) or super()._extract_message(req)
+
+    @staticmethod
+    async def _expected_entity(agent, sender_id: Optional[str]) -> Optional[str]:
+        """Entity asked for by the bot's last action in the conversation, if any."""
+        if not sender_id or agent is None or agent.tracker_store is None:
+            return None
+        try:
+            tracker = await agent.tracker_store.retrieve(sender_id)
+        except Exception as e:
+            logger.warning(f"Fast path skipped, tracker for {sender_id} unavailable: {e}")
+            return None
+        for event in reversed(tracker.events if tracker else []):
+            if isinstance(event, ActionExecuted) and event.action_name != ACTION_LISTEN_NAME:
+                return PROMPT_ENTITIES.get(event.action_name)
+        return None
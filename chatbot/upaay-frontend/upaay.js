@@ -153,7 +153,8 @@ document.addEventListener('DOMContentLoaded', function() {
         });
         try {
             console.log("Sending to Rasa:", message);
-            const response = await fetch(rasaServerUrl, {
+            // stream=true makes Rasa send each reply as soon as its action finishes
+            const response = await fetch(rasaServerUrl + '?stream=true', {
                 method: 'POST',
                 headers: {
                     'Content-Type': 'application/json',
@@ -171,10 +172,11 @@ document.addEventListener('DOMContentLoaded', function() {
                 throw new Error(`HTTP error! status: ${response.status}`);
             }
 
-            const data = await response.json();
-            console.log("Rasa response:", data);
             updateConnectionStatus('connected');
-            processRasaResponse(data);
+            await readMessages(response, function(data) {
+                console.log("Rasa response:", data);
+                processRasaResponse([data]);
+            });
         } catch (error) {
             console.error('Rasa API Error:', error);
             updateConnectionStatus('disconnected');
@@ -183,6 +185,29 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     }
 
+    // Streamed replies are one JSON message per line; show each line once it is complete
+    async function readMessages(response, onMessage) {
+        const handleLine = line => {
+            if (line.trim()) onMessage(JSON.parse(line));
+        };
+        if (!response.body) {
+            (await response.text()).split('\n').forEach(handleLine);
+            return;
+        }
+        const reader = response.body.getReader();
+        const decoder = new TextDecoder();
+        let buffer = '';
+        while (true) {
+            const { done, value } = await reader.read();
+            if (done) break;
+            buffer += decoder.decode(value, { stream: true });
+            const lines = buffer.split('\n');
+            buffer = lines.pop();
+            lines.forEach(handleLine);
+        }
+        handleLine(buffer + decoder.decode());
+    }
+
     function processRasaResponse(responses) {
         responses.forEach(response => {
             if (response.text) {
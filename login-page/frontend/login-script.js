@@ -36,6 +36,7 @@ loginTab.addEventListener("click", () => {
       const data = await response.json();
       if (response.ok) {
         localStorage.setItem("userEmail", email);
+        localStorage.setItem("authToken", data.token);
         window.location.href = "../../home-page/frontend/home-index.html";
       } else {
         alert(data.error || "Login failed.");